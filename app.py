@@ -1,18 +1,35 @@
 from flask import Flask, render_template, request, jsonify, redirect, url_for, session, flash
 from newsapi import NewsApiClient
 from deep_translator import GoogleTranslator
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne, ReturnDocument, ASCENDING, DESCENDING
+from pymongo.errors import DuplicateKeyError, OperationFailure
 from bson.objectid import ObjectId
 from werkzeug.security import generate_password_hash, check_password_hash
 from datetime import datetime
 import os
+import time
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait
+import multiprocessing
 from bs4 import BeautifulSoup
 import requests
-from urllib.parse import urlparse
-from textblob import TextBlob  # AI Library
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from contextlib import contextmanager
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
+from scoring import CATEGORY_KEYWORDS, keyword_hits, detect_fake_news_advanced, score_item
+try:
+    from lxml import etree as lxml_etree  # Optional: fast HTML extraction backend
+except ImportError:
+    lxml_etree = None
 from gtts import gTTS
-from io import BytesIO
-from flask import send_file
+from flask import send_file, Response
+import itertools
+import click
+import atexit
 
 app = Flask(__name__)
 app.secret_key = "secret123"
@@ -28,6 +45,447 @@ db = client["truebayan"]
 def get_db():
     return db
 
+# ---------- NEWSAPI RESPONSE CACHE ----------
+# Tunables (seconds / number of distinct queries kept)
+NEWS_CACHE_TTL = int(os.environ.get("NEWS_CACHE_TTL", 300))
+NEWS_CACHE_SIZE = int(os.environ.get("NEWS_CACHE_SIZE", 128))
+# How long a request thread waits on an in-flight NewsAPI call before giving up
+NEWS_FETCH_TIMEOUT = float(os.environ.get("NEWS_FETCH_TIMEOUT", 8))
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after `ttl` seconds.
+    Keeps hit/miss/eviction counters so the sizes can be tuned.
+    """
+    def __init__(self, maxsize=128, ttl=300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                # Expired entries stay around (until evicted) for get_stale()
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, ttl=None):
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+
+    def get_stale(self, key, default=None):
+        """Return a value even if it has expired (fallback when refreshing fails)"""
+        with self._lock:
+            entry = self._data.get(key)
+            return entry[1] if entry is not None else default
+
+    def delete(self, key):
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0
+            }
+
+class _FlightCall:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key into one in-flight call.
+    The call runs on its own thread, so every caller (including the first one)
+    can stop waiting after `timeout` while the fetch still completes and warms the cache.
+    """
+    def __init__(self):
+        self._calls = {}
+        self._lock = threading.Lock()
+        self.started = 0
+        self.coalesced = 0
+
+    def do(self, key, fn, timeout=None):
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _FlightCall()
+                self._calls[key] = call
+                self.started += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+
+        if leader:
+            threading.Thread(target=self._run, args=(key, call, fn), daemon=True).start()
+
+        if not call.done.wait(timeout):
+            raise TimeoutError(f"Timed out after {timeout}s waiting for {key!r}")
+
+        # Errors are shared with every waiter but never cached
+        if call.error is not None:
+            raise call.error
+        return call.result
+
+    def _run(self, key, call, fn):
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.done.set()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "in_flight": len(self._calls),
+                "started": self.started,
+                "coalesced": self.coalesced
+            }
+
+news_cache = TTLCache(maxsize=NEWS_CACHE_SIZE, ttl=NEWS_CACHE_TTL)
+news_flight = SingleFlight()
+
+def news_cache_key(q, language, sort_by, page_size):
+    """Normalize query params so equivalent queries share one cache slot"""
+    # NewsAPI operators (AND/OR/NOT) are case-sensitive, so only whitespace is folded
+    return (" ".join((q or "").split()), (language or "").lower(), sort_by or "", int(page_size))
+
+def fetch_news(q, language="en", sort_by="publishedAt", page_size=20):
+    """
+    Cached wrapper around newsapi.get_everything() that returns the articles list.
+    Concurrent misses for the same query share one upstream call; if that call
+    fails or is too slow, the last known (stale) result is served instead.
+    Callers get their own copies, so adding labels/summaries never leaks into the cache.
+    """
+    key = news_cache_key(q, language, sort_by, page_size)
+    articles = news_cache.get(key)
+    
+    if articles is None:
+        def load():
+            result = newsapi.get_everything(
+                q=q,
+                language=language,
+                sort_by=sort_by,
+                page_size=page_size
+            )["articles"]
+            news_cache.set(key, result)
+            return result
+
+        try:
+            articles = news_flight.do(key, load, timeout=NEWS_FETCH_TIMEOUT)
+        except Exception as e:
+            articles = news_cache.get_stale(key)
+            if articles is None:
+                raise
+            print(f"NewsAPI error, serving stale results: {e}")
+    
+    return [dict(article) for article in articles]
+
+# ---------- PARALLEL FETCHING ----------
+# Shared, bounded pool for a page's independent fetches (NewsAPI, MongoDB)
+FETCH_WORKERS = int(os.environ.get("FETCH_WORKERS", 16))
+PAGE_DEADLINE = float(os.environ.get("PAGE_DEADLINE", 10))  # seconds per request
+fetch_executor = ThreadPoolExecutor(max_workers=FETCH_WORKERS, thread_name_prefix="fetch")
+
+def run_parallel(tasks, timeout=None, defaults=None):
+    """
+    Runs independent zero-argument callables concurrently on fetch_executor.
+    `tasks` maps a name to a callable; returns {name: result}.
+    A task that fails or misses the deadline gets its value from `defaults` (or None).
+    Tasks must not call run_parallel themselves (they would wait on their own pool).
+    """
+    defaults = defaults or {}
+    deadline = time.monotonic() + (PAGE_DEADLINE if timeout is None else timeout)
+    futures = {name: fetch_executor.submit(fn) for name, fn in tasks.items()}
+    results = {}
+
+    for name, future in futures.items():
+        try:
+            results[name] = future.result(timeout=max(0, deadline - time.monotonic()))
+        except Exception as e:
+            future.cancel()
+            print(f"Parallel fetch '{name}' failed: {e!r}")
+            results[name] = defaults.get(name)
+
+    return results
+
+# ---------- FEED QUERIES ----------
+# Fixed feeds shown on the landing page / dashboard. These are polled by the
+# ingestion worker and stored pre-enriched in the `articles` collection.
+NEWS_FEEDS = {
+    "landing_headlines": {
+        "q": 'Philippines OR Manila OR "Philippine news" OR Duterte OR Marcos',
+        "page_size": 12
+    },
+    "dashboard_headlines": {
+        "q": 'Philippines OR Manila OR "Philippine news" OR "Metro Manila" OR Cebu OR Davao',
+        "page_size": 18
+    },
+    "latest": {
+        "q": 'Philippines OR Manila OR Cebu OR Davao OR Duterte OR Marcos OR Philippine',
+        "page_size": 50
+    },
+    "recommended": {
+        "q": '(Philippines OR Manila OR Cebu OR Davao OR Mindanao OR Luzon OR Visayas OR "Philippine government" OR "Filipino" OR Quezon OR Makati OR Pasig)',
+        "page_size": 12
+    },
+    "api": {
+        "q": 'Philippines OR Manila OR "Philippine news"',
+        "page_size": 15
+    }
+}
+
+# ---------- ARTICLE STATS ----------
+# Per-URL like/save counters ({url, like_count, save_count}) kept up to date with
+# $inc by the like/save routes, so rendering never has to $group the raw collections.
+# reconcile_article_stats() rebuilds them from article_likes / saved_articles.
+# A URL without a counter document yet (e.g. liked before the counters existed)
+# is counted from the raw collections once, by backfill_article_stats(). Only
+# non-zero counts are stored, so looking up URLs nobody liked writes nothing.
+#
+# Two first likes/saves racing on the same URL can both miss the $inc and
+# backfill concurrently; the later count wins ($max), but one interleaved with
+# an unlike can still drift by one until reconcile_article_stats() runs.
+#
+# Headline URLs are decorated on every page view, so the counters are also kept in
+# a short-TTL in-process cache (zeros included). Toggles in this process write the
+# new values straight into it; other processes catch up within SOCIAL_CACHE_TTL.
+SOCIAL_CACHE_TTL = int(os.environ.get("SOCIAL_CACHE_TTL", 30))
+SOCIAL_CACHE_SIZE = int(os.environ.get("SOCIAL_CACHE_SIZE", 2048))
+
+social_cache = TTLCache(maxsize=SOCIAL_CACHE_SIZE, ttl=SOCIAL_CACHE_TTL)
+
+def invalidate_social_counts(urls=None):
+    """Drops cached counters for `urls` (or all of them)"""
+    if urls is None:
+        social_cache.clear()
+        return
+    for url in urls:
+        social_cache.delete(url)
+
+def backfill_article_stats(urls):
+    """Counts likes/saves for URLs with no counter document yet and stores them; returns {url: counts}"""
+    db = get_db()
+    counts = {url: [0, 0] for url in urls}
+    for item in db.article_likes.aggregate([
+        {"$match": {"article_url": {"$in": list(counts)}}},
+        {"$group": {"_id": "$article_url", "count": {"$sum": 1}}}
+    ]):
+        counts[item["_id"]][0] = item["count"]
+    for item in db.saved_articles.aggregate([
+        {"$match": {"url": {"$in": list(counts)}}},
+        {"$group": {"_id": "$url", "count": {"$sum": 1}}}
+    ]):
+        counts[item["_id"]][1] = item["count"]
+
+    # Zeros stay in social_cache only. $max: of two racing backfills, the
+    # later count (which includes both likes) wins
+    ops = [
+        UpdateOne(
+            {"url": url},
+            {"$max": {"like_count": likes, "save_count": saves}},
+            upsert=True
+        )
+        for url, (likes, saves) in counts.items() if likes or saves
+    ]
+    if ops:
+        db.article_stats.bulk_write(ops, ordered=False)
+    return {url: tuple(pair) for url, pair in counts.items()}
+
+def bump_article_stats(url, likes=0, saves=0):
+    if not url:
+        return
+    try:
+        # No upsert: a missing counter is backfilled from the raw collections,
+        # which already include this like/save, instead of starting from zero
+        doc = get_db().article_stats.find_one_and_update(
+            {"url": url},
+            {"$inc": {"like_count": likes, "save_count": saves}},
+            projection={"_id": 0, "like_count": 1, "save_count": 1},
+            return_document=ReturnDocument.AFTER
+        )
+        if doc is None:
+            counts = backfill_article_stats([url])[url]
+        else:
+            counts = (doc.get("like_count", 0), doc.get("save_count", 0))
+        social_cache.set(url, counts)
+    except Exception as e:
+        print(f"Article stats update error: {e}")
+        invalidate_social_counts([url])
+
+def get_article_stats(urls):
+    """Returns {url: (like_count, save_count)}; only cache misses hit MongoDB, in one $in lookup"""
+    found = {}
+    missing = []
+    for url in urls:
+        counts = social_cache.get(url)
+        if counts is None:
+            missing.append(url)
+        else:
+            found[url] = counts
+
+    if missing:
+        docs = get_db().article_stats.find(
+            {"url": {"$in": missing}},
+            {"_id": 0, "url": 1, "like_count": 1, "save_count": 1}
+        )
+        fetched = {doc["url"]: (doc.get("like_count", 0), doc.get("save_count", 0)) for doc in docs}
+        unknown = [url for url in dict.fromkeys(missing) if url not in fetched]
+        if unknown:
+            fetched.update(backfill_article_stats(unknown))
+        for url in missing:
+            found[url] = fetched[url]
+            social_cache.set(url, found[url])
+
+    return found
+
+def reconcile_article_stats():
+    """Recomputes every counter from the raw collections; returns the number of URLs written"""
+    db = get_db()
+    started = datetime.now()
+    counts = {}
+    for item in db.article_likes.aggregate([{"$group": {"_id": "$article_url", "count": {"$sum": 1}}}]):
+        counts.setdefault(item["_id"], [0, 0])[0] = item["count"]
+    for item in db.saved_articles.aggregate([{"$group": {"_id": "$url", "count": {"$sum": 1}}}]):
+        counts.setdefault(item["_id"], [0, 0])[1] = item["count"]
+
+    ops = [
+        UpdateOne(
+            {"url": url},
+            {"$set": {"like_count": likes, "save_count": saves, "reconciled_at": started}},
+            upsert=True
+        )
+        for url, (likes, saves) in counts.items() if url
+    ]
+    for i in range(0, len(ops), 1000):
+        db.article_stats.bulk_write(ops[i:i + 1000], ordered=False)
+
+    # Counters for URLs with no likes or saves left
+    db.article_stats.update_many(
+        {"reconciled_at": {"$ne": started}},
+        {"$set": {"like_count": 0, "save_count": 0}}
+    )
+    db.article_stats.delete_many({"like_count": {"$lte": 0}, "save_count": {"$lte": 0}})
+    invalidate_social_counts()
+    return len(ops)
+
+# ---------- USER STATS ----------
+# Each user's liked_count / saved_count live on their `users` document and are
+# $inc'd by the like/save routes, with a small in-process cache in front, so
+# /get_user_stats never counts documents. Users created before the counters
+# existed are counted once on first read. The $inc only applies once the fields
+# exist, so it can't start a legacy user's counter from zero.
+USER_STATS_TTL = int(os.environ.get("USER_STATS_TTL", 300))
+
+user_stats_cache = TTLCache(maxsize=4096, ttl=USER_STATS_TTL)
+
+def bump_user_stats(user_id, likes=0, saves=0):
+    try:
+        doc = get_db().users.find_one_and_update(
+            {"_id": ObjectId(user_id), "liked_count": {"$exists": True}, "saved_count": {"$exists": True}},
+            {"$inc": {"liked_count": likes, "saved_count": saves}},
+            projection={"_id": 0, "liked_count": 1, "saved_count": 1},
+            return_document=ReturnDocument.AFTER
+        )
+    except Exception as e:
+        print(f"User stats update error: {e}")
+        doc = None
+
+    if doc:
+        user_stats_cache.set(str(user_id), {"saved_count": doc["saved_count"], "liked_count": doc["liked_count"]})
+    else:
+        user_stats_cache.delete(str(user_id))
+
+def get_user_counts(user_id):
+    """Returns {"saved_count", "liked_count"} from the cache or the user document"""
+    counts = user_stats_cache.get(str(user_id))
+    if counts is not None:
+        return counts
+
+    db = get_db()
+    user_id_obj = ObjectId(user_id)
+    doc = db.users.find_one({"_id": user_id_obj}, {"saved_count": 1, "liked_count": 1}) or {}
+    if "saved_count" in doc and "liked_count" in doc:
+        counts = {"saved_count": doc["saved_count"], "liked_count": doc["liked_count"]}
+    else:
+        counts = {
+            "saved_count": db.saved_articles.count_documents({"user_id": user_id_obj}),
+            "liked_count": db.article_likes.count_documents({"user_id": user_id_obj})
+        }
+        db.users.update_one({"_id": user_id_obj}, {"$set": counts})
+
+    user_stats_cache.set(str(user_id), counts)
+    return counts
+
+def reconcile_user_stats():
+    """Recomputes every user's counters from the raw collections; returns the number of users written"""
+    db = get_db()
+    started = datetime.now()
+    counts = {}
+    for item in db.article_likes.aggregate([{"$group": {"_id": "$user_id", "count": {"$sum": 1}}}]):
+        counts.setdefault(item["_id"], [0, 0])[0] = item["count"]
+    for item in db.saved_articles.aggregate([{"$group": {"_id": "$user_id", "count": {"$sum": 1}}}]):
+        counts.setdefault(item["_id"], [0, 0])[1] = item["count"]
+
+    ops = [
+        UpdateOne(
+            {"_id": user_id},
+            {"$set": {"liked_count": likes, "saved_count": saves, "stats_reconciled_at": started}}
+        )
+        for user_id, (likes, saves) in counts.items()
+    ]
+    for i in range(0, len(ops), 1000):
+        db.users.bulk_write(ops[i:i + 1000], ordered=False)
+
+    db.users.update_many(
+        {"stats_reconciled_at": {"$ne": started}},
+        {"$set": {"liked_count": 0, "saved_count": 0, "stats_reconciled_at": started}}
+    )
+    user_stats_cache.clear()
+    return len(ops)
+
+@app.cli.command("reconcile-stats")
+def reconcile_stats_command():
+    """Rebuild article_stats and per-user like/save counters (e.g. nightly from cron)"""
+    print(f"Reconciled {reconcile_article_stats()} article counters")
+    print(f"Reconciled {reconcile_user_stats()} user counters")
+
 # ---------- FUNCTIONS ----------
 
 # NEW FUNCTION: Attach database counts to NewsAPI articles
@@ -47,24 +505,10 @@ def attach_social_data(articles, current_user_id=None):
 
     db = get_db()
 
-    # 1. Get Global Like Counts
-    # SQL: SELECT article_url, COUNT(*) ... GROUP BY article_url
-    like_pipeline = [
-        {"$match": {"article_url": {"$in": urls}}},
-        {"$group": {"_id": "$article_url", "count": {"$sum": 1}}}
-    ]
-    like_results = list(db.article_likes.aggregate(like_pipeline))
-    like_counts = {item['_id']: item['count'] for item in like_results}
-
-    # 2. Get Global Save Counts
-    save_pipeline = [
-        {"$match": {"url": {"$in": urls}}},
-        {"$group": {"_id": "$url", "count": {"$sum": 1}}}
-    ]
-    save_results = list(db.saved_articles.aggregate(save_pipeline))
-    save_counts = {item['_id']: item['count'] for item in save_results}
+    # 1. Global Like / Save Counts (denormalized in article_stats)
+    stats = get_article_stats(urls)
 
-    # 3. Check User Specific Actions (if logged in)
+    # 2. Check User Specific Actions (if logged in)
     user_likes = set()
     user_saves = set()
     
@@ -86,137 +530,27 @@ def attach_social_data(articles, current_user_id=None):
     # Attach data to article objects
     for a in articles:
         url = a.get('url')
-        a['likes'] = like_counts.get(url, 0)
-        a['saves'] = save_counts.get(url, 0)
+        a['likes'], a['saves'] = stats.get(url, (0, 0))
         a['user_liked'] = url in user_likes
         a['user_saved'] = url in user_saves
 
     return articles
 
+# ---------- KEYWORD MATCHING ----------
+# Keyword tables, the matcher and detect_fake_news_advanced live in scoring.py
 def is_philippine_news(article):
     """Check if article is related to Philippines"""
-    philippine_keywords = [
-        'philippines', 'philippine', 'manila', 'filipino', 'filipina',
-        'cebu', 'davao', 'mindanao', 'luzon', 'visayas',
-        'duterte', 'marcos', 'quezon', 'makati', 'pasig',
-        'senate', 'congress', 'doh', 'dilg', 'pnp',
-        'abs-cbn', 'gma', 'pba', 'gilas', 'pacquiao'
-    ]
-    
     title = article.get('title', '').lower()
     description = article.get('description', '').lower() if article.get('description') else ''
     content = article.get('content', '').lower() if article.get('content') else ''
     
     # Check if any Philippine keyword is in title, description, or content
-    text_to_check = f"{title} {description} {content}"
-    return any(keyword in text_to_check for keyword in philippine_keywords)
+    return 'philippine' in keyword_hits(title, description, content)
 
 def filter_philippine_news(articles):
     """Filter articles to only include Philippine-related news"""
     return [article for article in articles if is_philippine_news(article)]
 
-def detect_fake_news_advanced(text, url=""):
-    """
-    Realistic AI Scoring: Separates Risk from Confidence.
-    Returns: (label, confidence_percentage, ai_risk_score, reasons)
-    """
-    if not text or len(text) < 100:
-        return "VERIFY", 0, 5.0, ["Content too short for accurate analysis"]
-    
-    blob = TextBlob(text)
-    sentiment = blob.sentiment
-    reasons = []
-    
-    # 1. BASELINE RISK (Start at 50 - Neutral/Unsure)
-    risk_score = 50 
-    
-    # 2. DOMAIN CHECK (The strongest signal)
-    trusted_domains = [
-        'rappler.com', 'inquirer.net', 'abs-cbn.com', 'gma.network', 'philstar.com', 
-        'cnnphilippines.com', 'manilabulletin.com', 'bworldonline.com', 'pna.gov.ph',
-        'bbc.com', 'reuters.com', 'apnews.com', 'nytimes.com', 'yugatech.com', 
-        'spot.ph', 'spin.ph', 'pep.ph',"gmanetwork.com"
-    ]
-    
-    domain_match = False
-    if url:
-        domain_match = any(domain in url.lower() for domain in trusted_domains)
-    
-    if domain_match:
-        risk_score -= 40  # Massive trust boost -> Drops to ~10 Risk
-        reasons.append("Source is Verified & Trusted")
-    else:
-        risk_score += 10  # Slight suspicion for unknown sites -> Rises to ~60 Risk
-        reasons.append("Source unverified (Proceed with caution)")
-
-    # 3. AI SENTIMENT ANALYSIS (Reality Check)
-    if sentiment.subjectivity > 0.6:
-        if sentiment.polarity < -0.2:
-            risk_score += 20
-            reasons.append("High Subjectivity + Negativity Detected")
-        else:
-            risk_score += 10
-            reasons.append("Opinionated Content Detected")
-    elif sentiment.subjectivity < 0.3:
-        risk_score -= 10
-        reasons.append("Objective/Factual Writing Style")
-
-    # Extreme Emotion Check (Too angry or too happy = Clickbait)
-    if abs(sentiment.polarity) > 0.8:
-        risk_score += 15
-        reasons.append("Extreme Emotional Language")
-
-    # 4. KEYWORD & PATTERN ANALYSIS
-    high_risk_keywords = [
-        "hoax", "conspiracy", "exposed", "secret", "shocking", 
-        "censored", "mainstream media", "government lies", "debunked",
-        "miracle cure", "bioweapon", "deep state", "wake up", "plot"
-    ]
-    
-    clickbait_keywords = [
-        "you won't believe", "shocking truth", "viral", "mind blowing", 
-        "this will change everything", "urgent", "breaking news", "omg"
-    ]
-
-    text_lower = text.lower()
-    
-    found_high_risk = [w for w in high_risk_keywords if w in text_lower]
-    if found_high_risk:
-        risk_score += 25
-        reasons.append(f"Suspicious keyword: '{found_high_risk[0]}'")
-
-    found_clickbait = [w for w in clickbait_keywords if w in text_lower]
-    if found_clickbait:
-        risk_score += 10
-        reasons.append(f"Clickbait style: '{found_clickbait[0]}'")
-
-    # 5. REALITY SCORING FORMULA
-    # Clamp Risk Score (0 = Safe, 100 = Fake)
-    final_risk = min(100, max(0, risk_score))
-    
-    # AI Score (0-10) for display. 
-    # High Score = High Risk of being Fake.
-    ai_score = round(final_risk / 10, 1)
-
-    # CONFIDENCE CALCULATION
-    confidence = abs(final_risk - 50) * 2
-    
-    # Boost confidence if we have a lot of text to analyze
-    if len(text) > 1000:
-        confidence = min(100, confidence + 10)
-
-    # Determine Label based on Risk
-    if final_risk >= 80:
-        label = "FAKE"
-    elif final_risk >= 70:
-        label = "SUSPICIOUS"
-    elif final_risk >= 50:
-        label = "VERIFY"
-    else:
-        label = "CREDIBLE"
-
-    return label, int(confidence), ai_score, reasons
-
 def detect_fake_news(text, url=""):
     """Wrapper for backward compatibility"""
     label, confidence, ai_score, reasons = detect_fake_news_advanced(text, url)
@@ -232,44 +566,368 @@ def translate_filipino(text):
     if not text:
         return ""
     try:
-        return GoogleTranslator(source="auto", target="tl").translate(text)
+        return cached_translate(text, target="tl")
     except:
         return text
 
 def detect_category(title, description):
     """Detect article category based on keywords"""
-    text = f"{title} {description}".lower()
-    
-    categories = {
-        'Politics': ['politics', 'government', 'election', 'senate', 'congress', 'president', 'mayor', 'duterte', 'marcos'],
-        'Business': ['business', 'economy', 'stock', 'market', 'company', 'trade', 'investment', 'peso', 'gdp'],
-        'Technology': ['technology', 'tech', 'smartphone', 'app', 'software', 'internet', 'digital', 'AI', 'gadget'],
-        'Sports': ['sports', 'basketball', 'boxing', 'football', 'pba', 'gilas', 'pacquiao', 'athlete', 'game'],
-        'Entertainment': ['entertainment', 'movie', 'celebrity', 'showbiz', 'abs-cbn', 'gma', 'actor', 'actress'],
-        'Health': ['health', 'medical', 'hospital', 'doctor', 'covid', 'vaccine', 'disease', 'doh', 'wellness'],
-        'Education': ['education', 'school', 'university', 'student', 'teacher', 'deped', 'ched', 'learning'],
-        'Environment': ['environment', 'climate', 'weather', 'typhoon', 'flood', 'pollution', 'pagasa', 'nature'],
-        'Crime': ['crime', 'police', 'arrest', 'murder', 'theft', 'pnp', 'investigation', 'suspect'],
-        'Weather': ['weather', 'typhoon', 'rain', 'storm', 'pagasa', 'forecast', 'temperature'],
-        'Lifestyle': ['lifestyle', 'fashion', 'travel', 'culture', 'art', 'tourism', 'food'],
-        'Food': ['food', 'restaurant', 'cuisine', 'recipe', 'chef', 'cooking', 'dining']
-    }
+    hits = keyword_hits(f"{title}".lower(), f"{description}".lower())
     
-    for category, keywords in categories.items():
-        if any(keyword in text for keyword in keywords):
+    for category in CATEGORY_KEYWORDS:
+        if category in hits:
             return category
     
     return 'General'
 
 def translate_text(text, target='tl'):
     try:
-        translator = GoogleTranslator(source='auto', target=target)
-        result = translator.translate(text)
+        result = cached_translate(text, target=target)
         return result
     except Exception as e:
         print(f"Translation library error: {e}")
         return text
 
+# ---------- TRANSLATION CACHE ----------
+# Hot in-memory tier in front of the `translations` collection, so each unique
+# text is sent to Google Translate once across users and restarts
+TRANSLATION_CACHE_SIZE = int(os.environ.get("TRANSLATION_CACHE_SIZE", 4096))
+TRANSLATION_CACHE_TTL = int(os.environ.get("TRANSLATION_CACHE_TTL", 86400))
+
+translation_cache = TTLCache(maxsize=TRANSLATION_CACHE_SIZE, ttl=TRANSLATION_CACHE_TTL)
+
+def translation_key(text, target):
+    return (hashlib.sha1(text.encode("utf-8")).hexdigest(), target)
+
+def cached_translate(text, target="tl"):
+    """
+    GoogleTranslator(source="auto") behind the translation cache.
+    Provider errors are raised to the caller and never cached.
+    """
+    key = translation_key(text, target)
+    translated = translation_cache.get(key)
+    if translated is not None:
+        return translated
+
+    db = get_db()
+    try:
+        doc = db.translations.find_one({"text_hash": key[0], "target": target}, {"translated": 1})
+    except Exception as e:
+        print(f"Translation cache read error: {e}")
+        doc = None
+
+    if doc:
+        translation_cache.set(key, doc["translated"])
+        return doc["translated"]
+
+    translated = GoogleTranslator(source="auto", target=target).translate(text)
+
+    if translated:
+        translation_cache.set(key, translated)
+        try:
+            db.translations.update_one(
+                {"text_hash": key[0], "target": target},
+                {"$set": {"translated": translated, "created_at": datetime.now()}},
+                upsert=True
+            )
+        except Exception as e:
+            print(f"Translation cache write error: {e}")
+
+    return translated
+
+# Own pool (not fetch_executor): translations are started from inside page fetch tasks
+TRANSLATE_WORKERS = int(os.environ.get("TRANSLATE_WORKERS", 8))
+TRANSLATE_DEADLINE = float(os.environ.get("TRANSLATE_DEADLINE", 3))  # seconds per result set
+translate_executor = ThreadPoolExecutor(max_workers=TRANSLATE_WORKERS, thread_name_prefix="translate")
+
+def translate_many(texts, target="tl", timeout=None):
+    """
+    Translates a list of texts concurrently under one overall deadline.
+    Returns a list aligned with `texts`; entries that failed or missed the
+    deadline are None. Late translations keep running and land in the
+    translation cache, so the next render picks them up.
+    """
+    results = [None] * len(texts)
+    futures = {}
+
+    for i, text in enumerate(texts):
+        if not text:
+            results[i] = ""
+            continue
+        cached = translation_cache.get(translation_key(text, target))
+        if cached is not None:
+            results[i] = cached
+        elif text not in futures:
+            futures[text] = translate_executor.submit(cached_translate, text, target)
+
+    if futures:
+        done, _ = wait(list(futures.values()), timeout=TRANSLATE_DEADLINE if timeout is None else timeout)
+        for i, text in enumerate(texts):
+            future = futures.get(text)
+            if future in done and future.exception() is None:
+                results[i] = future.result()
+
+    return results
+
+# ---------- LONG TEXT TRANSLATION ----------
+TRANSLATE_CHUNK_LIMIT = int(os.environ.get("TRANSLATE_CHUNK_LIMIT", 4500))  # provider max chars
+TRANSLATE_CHUNK_SPREAD = 4  # avg. paragraphs per chunk before a content-defined break
+TRANSLATE_ARTICLE_DEADLINE = float(os.environ.get("TRANSLATE_ARTICLE_DEADLINE", 20))
+
+def split_long_paragraph(paragraph, limit):
+    """Packs sentences (or, for huge sentences, words) into pieces of at most `limit` chars"""
+    pieces = []
+    current = ""
+    for sentence in re.split(r'(?<=[.!?])\s+', paragraph):
+        while len(sentence) > limit:
+            cut = sentence.rfind(" ", 0, limit)
+            cut = cut if cut > 0 else limit
+            if current:
+                pieces.append(current)
+                current = ""
+            pieces.append(sentence[:cut])
+            sentence = sentence[cut:].lstrip()
+        if current and len(current) + 1 + len(sentence) > limit:
+            pieces.append(current)
+            current = sentence
+        else:
+            current = f"{current} {sentence}" if current else sentence
+    if current:
+        pieces.append(current)
+    return pieces
+
+def chunk_text(text, limit=None):
+    """
+    Splits text on paragraph and sentence boundaries into chunks under `limit` chars.
+    Returns [(separator_before, chunk)] so translate_long_text() can reassemble in order.
+    Chunks also end after paragraphs whose hash hits a marker, so editing one
+    paragraph doesn't shift every later chunk edge (and their cache keys).
+    """
+    limit = limit or TRANSLATE_CHUNK_LIMIT
+
+    pieces = []  # (separator_before, piece)
+    for paragraph in re.split(r'\n\s*\n', text):
+        paragraph = paragraph.strip()
+        if not paragraph:
+            continue
+        for i, piece in enumerate(split_long_paragraph(paragraph, limit)):
+            pieces.append((" " if i else "\n\n", piece))
+
+    chunks = []
+    current = []
+    size = 0
+
+    def flush():
+        if current:
+            chunk = current[0][1] + "".join(sep + piece for sep, piece in current[1:])
+            chunks.append((current[0][0], chunk))
+            current.clear()
+
+    for sep, piece in pieces:
+        if current and size + len(sep) + len(piece) > limit:
+            flush()
+            size = 0
+        size += (len(sep) if current else 0) + len(piece)
+        current.append((sep, piece))
+        digest = hashlib.md5(piece.encode("utf-8")).digest()
+        if sep == "\n\n" and digest[0] % TRANSLATE_CHUNK_SPREAD == 0:
+            flush()
+            size = 0
+    flush()
+
+    return chunks
+
+def translate_long_text(text, target="tl", timeout=None):
+    """
+    Translates text of any length: chunks are translated in parallel (each one
+    cached on its own) and reassembled in order. A chunk that fails or misses
+    the deadline is kept in the original language.
+    """
+    chunks = chunk_text(text)
+    if not chunks:
+        return text
+
+    translations = translate_many(
+        [chunk for _, chunk in chunks],
+        target=target,
+        timeout=TRANSLATE_ARTICLE_DEADLINE if timeout is None else timeout
+    )
+
+    parts = []
+    for i, ((sep, chunk), translated) in enumerate(zip(chunks, translations)):
+        if translated is None:
+            print(f"Translation chunk {i + 1}/{len(chunks)} not translated, keeping original")
+            translated = chunk
+        parts.append(translated if i == 0 else sep + translated)
+
+    return "".join(parts)
+
+# ---------- ARTICLE ENRICHMENT CACHE ----------
+# In-process LRU tier in front of an optional MongoDB tier (`article_enrichment`);
+# both expire after ENRICH_CACHE_TTL (the MongoDB one via a TTL index on updated_at)
+ENRICH_CACHE_SIZE = int(os.environ.get("ENRICH_CACHE_SIZE", 2048))
+ENRICH_CACHE_TTL = int(os.environ.get("ENRICH_CACHE_TTL", 86400))
+ENRICH_CACHE_MONGO = os.environ.get("ENRICH_CACHE_MONGO", "1") == "1"
+
+enrichment_cache = TTLCache(maxsize=ENRICH_CACHE_SIZE, ttl=ENRICH_CACHE_TTL)
+
+ENRICHMENT_FIELDS = ("label", "confidence", "ai_score", "reasons", "category", "summary")
+
+def enrichment_key(url, description):
+    return (url or "", hashlib.sha1(description.encode("utf-8")).hexdigest())
+
+def build_enrichment(title, description, score):
+    label, confidence, ai_score, reasons = score
+    return {
+        "label": label,
+        "confidence": confidence,
+        "ai_score": ai_score,
+        "reasons": list(reasons),
+        "category": detect_category(title, description),
+        "summary": summarize(description)
+    }
+
+def lookup_enrichments(keys):
+    """Returns {key: enrichment} for the keys found in either cache tier"""
+    found = {}
+    missing = []
+    for key in keys:
+        enrichment = enrichment_cache.get(key)
+        if enrichment is not None:
+            found[key] = enrichment
+        elif key[0]:
+            missing.append(key)
+
+    if ENRICH_CACHE_MONGO and missing:
+        wanted = set(missing)
+        try:
+            docs = get_db().article_enrichment.find(
+                {"url": {"$in": list(set(url for url, _ in missing))}},
+                dict({"url": 1, "desc_hash": 1}, **{field: 1 for field in ENRICHMENT_FIELDS})
+            )
+            for doc in docs:
+                key = (doc["url"], doc.get("desc_hash"))
+                if key in wanted:
+                    found[key] = {field: doc.get(field) for field in ENRICHMENT_FIELDS}
+                    enrichment_cache.set(key, found[key])
+        except Exception as e:
+            print(f"Enrichment cache read error: {e}")
+
+    return found
+
+def store_enrichments(items):
+    """Writes [(key, enrichment)] to both cache tiers"""
+    ops = []
+    for key, enrichment in items:
+        enrichment_cache.set(key, enrichment)
+        if key[0]:
+            ops.append(UpdateOne(
+                {"url": key[0], "desc_hash": key[1]},
+                {"$set": dict(enrichment, updated_at=datetime.now())},
+                upsert=True
+            ))
+
+    if ENRICH_CACHE_MONGO and ops:
+        try:
+            get_db().article_enrichment.bulk_write(ops, ordered=False)
+        except Exception as e:
+            print(f"Enrichment cache write error: {e}")
+
+def enrich_articles(articles, translate=True, translate_timeout=None):
+    """
+    Adds summary, label, category, scores (and Filipino translation) to NewsAPI articles.
+    NLP results are memoized by (url, hash of description); only cache misses are
+    scored, together, through score_fake_news_batch(). Translations run concurrently
+    via translate_many(); articles that miss its deadline get filipino=None.
+    """
+    keys = [enrichment_key(a.get("url"), a.get("description") or "") for a in articles]
+    cached = lookup_enrichments(keys)
+
+    pending = {}
+    for article, key in zip(articles, keys):
+        if key not in cached:
+            pending.setdefault(key, article)
+
+    if pending:
+        scores = score_fake_news_batch(
+            [(article.get("description") or "", "") for article in pending.values()]
+        )
+        computed = [
+            (key, build_enrichment(article.get("title", ""), article.get("description") or "", score))
+            for (key, article), score in zip(pending.items(), scores)
+        ]
+        store_enrichments(computed)
+        cached.update(computed)
+
+    for article, key in zip(articles, keys):
+        article.update(cached[key])
+
+    if translate:
+        translations = translate_many(
+            [article.get("description") or "" for article in articles],
+            target="tl",
+            timeout=translate_timeout
+        )
+        for article, translation in zip(articles, translations):
+            article["filipino"] = translation
+
+    return articles
+
+def enrich_article(article, translate=True):
+    """Single-article version of enrich_articles()"""
+    return enrich_articles([article], translate)[0]
+
+# ---------- BATCH FAKE NEWS SCORING ----------
+# detect_fake_news_advanced is CPU-bound (TextBlob), so big batches go to a process pool.
+# Workers only need scoring.py; the pool is warmed by start_background_services.
+SCORING_WORKERS = int(os.environ.get("SCORING_WORKERS", os.cpu_count() or 1))
+SCORING_BATCH_MIN = int(os.environ.get("SCORING_BATCH_MIN", 16))  # smaller batches stay in-process
+
+_scoring_pool = None
+_scoring_pool_lock = threading.Lock()
+
+def get_scoring_pool():
+    global _scoring_pool
+    with _scoring_pool_lock:
+        if _scoring_pool is None:
+            # spawn: never fork a process that already runs request/worker threads
+            _scoring_pool = ProcessPoolExecutor(
+                max_workers=SCORING_WORKERS,
+                mp_context=multiprocessing.get_context("spawn")
+            )
+        return _scoring_pool
+
+def warm_scoring_pool():
+    """Starts the pool's workers ahead of the first big batch (called at startup)"""
+    if SCORING_WORKERS < 2:
+        return
+    try:
+        list(get_scoring_pool().map(score_item, [("", "")] * SCORING_WORKERS))
+    except Exception as e:
+        print(f"Scoring pool warm-up error: {e!r}")
+
+def score_fake_news_batch(items):
+    """
+    Scores [(text, url), ...] with detect_fake_news_advanced.
+    Returns [(label, confidence, ai_score, reasons), ...] in input order.
+    """
+    global _scoring_pool
+    items = [(text or "", url or "") for text, url in items]
+
+    if len(items) < SCORING_BATCH_MIN or SCORING_WORKERS < 2:
+        return [score_item(item) for item in items]
+
+    try:
+        chunksize = max(1, len(items) // (SCORING_WORKERS * 4))
+        return list(get_scoring_pool().map(score_item, items, chunksize=chunksize))
+    except Exception as e:
+        print(f"Scoring pool error, scoring in-process: {e!r}")
+        with _scoring_pool_lock:
+            if _scoring_pool is not None:
+                _scoring_pool.shutdown(wait=False, cancel_futures=True)
+                _scoring_pool = None
+        return [score_item(item) for item in items]
+
 @app.route('/translate_article', methods=['POST'])
 def translate_article():
     try:
@@ -279,9 +937,7 @@ def translate_article():
         if not original_content:
             return jsonify({'error': 'No text provided'}), 400
 
-        safe_content = original_content[:4500] 
-        
-        translated_content = translate_text(safe_content, target='tl')
+        translated_content = translate_long_text(original_content, target='tl')
         
         return jsonify({
             'status': 'success',
@@ -292,23 +948,74 @@ def translate_article():
         print(f"Server Error: {e}")
         return jsonify({'error': str(e)}), 500
     
-@app.route('/api/speak', methods=['POST'])
+# ---------- TTS AUDIO CACHE ----------
+# Content-addressed MP3 files: sha1(lang + text).mp3
+TTS_CACHE_DIR = os.environ.get("TTS_CACHE_DIR", os.path.join(app.root_path, "tts_cache"))
+TTS_CACHE_MAX_FILES = int(os.environ.get("TTS_CACHE_MAX_FILES", 2000))
+
+def tts_cache_path(text, lang):
+    digest = hashlib.sha1(f"{lang}\n{text}".encode("utf-8")).hexdigest()
+    return os.path.join(TTS_CACHE_DIR, f"{digest}.mp3")
+
+def prune_tts_cache():
+    """Keeps the newest TTS_CACHE_MAX_FILES files"""
+    try:
+        files = [e for e in os.scandir(TTS_CACHE_DIR) if e.name.endswith(".mp3")]
+        if len(files) <= TTS_CACHE_MAX_FILES:
+            return
+        files.sort(key=lambda e: e.stat().st_mtime)
+        for entry in files[:len(files) - TTS_CACHE_MAX_FILES]:
+            os.remove(entry.path)
+    except OSError as e:
+        print(f"TTS cache prune error: {e}")
+
+def stream_tts(text, lang, path):
+    """
+    Yields MP3 segments as gTTS synthesizes each sentence-sized part, and saves
+    the complete file to `path` once the last part is done.
+    """
+    parts = gTTS(text=text, lang=lang).stream()
+    # Pull the first segment now so upstream errors still become a 500 response
+    first = next(parts, b"")
+
+    def generate():
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.part"
+        saved = False
+        try:
+            with open(tmp_path, "wb") as f:
+                for part in itertools.chain([first], parts):
+                    f.write(part)
+                    yield part
+            os.replace(tmp_path, path)
+            saved = True
+            prune_tts_cache()
+        except Exception as e:
+            print(f"TTS stream error: {e}")
+        finally:
+            if not saved and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    return generate()
+
+@app.route('/api/speak', methods=['GET', 'POST'])
 def api_speak():
     try:
-        data = request.json
+        # GET lets <audio src=...> stream and seek; POST is kept for fetch() callers
+        data = request.json if request.method == 'POST' else request.args
         text = data.get('text', '')
         lang = data.get('lang', 'en')
 
         if not text:
             return jsonify({'error': 'No text provided'}), 400
 
-        tts = gTTS(text=text, lang=lang)
-        
-        audio_fp = BytesIO()
-        tts.write_to_fp(audio_fp)
-        audio_fp.seek(0)
-        
-        return send_file(audio_fp, mimetype='audio/mp3')
+        path = tts_cache_path(text, lang)
+
+        if os.path.exists(path):
+            # conditional=True adds Range / If-None-Match support
+            return send_file(path, mimetype='audio/mp3', conditional=True)
+
+        os.makedirs(TTS_CACHE_DIR, exist_ok=True)
+        return Response(stream_tts(text, lang, path), mimetype='audio/mp3')
     except Exception as e:
         print(f"TTS Error: {e}")
         return jsonify({'error': str(e)}), 500
@@ -335,14 +1042,21 @@ def toggle_like():
     })
     
     if existing_like:
-        db.article_likes.delete_one({"_id": existing_like['_id']})
+        if db.article_likes.delete_one({"_id": existing_like['_id']}).deleted_count:
+            bump_article_stats(url, likes=-1)
+            bump_user_stats(user_id, likes=-1)
         action = "unliked"
     else:
-        db.article_likes.insert_one({
-            "user_id": ObjectId(user_id),
-            "article_url": url,
-            "created_at": datetime.now()
-        })
+        try:
+            db.article_likes.insert_one({
+                "user_id": ObjectId(user_id),
+                "article_url": url,
+                "created_at": datetime.now()
+            })
+            bump_article_stats(url, likes=1)
+            bump_user_stats(user_id, likes=1)
+        except DuplicateKeyError:
+            pass  # A concurrent request already liked it
         action = "liked"
         
     return jsonify({"status": "success", "action": action})
@@ -418,15 +1132,22 @@ def toggle_save():
     })
     
     if existing:
-        db.saved_articles.delete_one({"_id": existing['_id']})
+        if db.saved_articles.delete_one({"_id": existing['_id']}).deleted_count:
+            bump_article_stats(url, saves=-1)
+            bump_user_stats(user_id, saves=-1)
         return jsonify({"status": "success", "action": "unsaved", "message": "Removed from saved"})
     else:
-        db.saved_articles.insert_one({
-            "user_id": ObjectId(user_id),
-            "title": title,
-            "url": url,
-            "saved_at": datetime.now()
-        })
+        try:
+            db.saved_articles.insert_one({
+                "user_id": ObjectId(user_id),
+                "title": title,
+                "url": url,
+                "saved_at": datetime.now()
+            })
+            bump_article_stats(url, saves=1)
+            bump_user_stats(user_id, saves=1)
+        except DuplicateKeyError:
+            pass  # A concurrent request already saved it
         return jsonify({"status": "success", "action": "saved", "message": "Added to saved"})
 
 @app.route("/check_saved", methods=["POST"])
@@ -444,20 +1165,347 @@ def check_saved():
     
     return jsonify({"saved": is_saved is not None})
 
+# ---------- BATCHED SOCIAL STATE ----------
+SOCIAL_STATE_MAX_URLS = 100
+
+@app.route("/social_state", methods=["POST"])
+def social_state():
+    """Like/save counts and the user's liked/saved flags for every card on a page in one call"""
+    data = request.get_json(silent=True) or {}
+    urls = [url for url in dict.fromkeys(data.get('urls') or []) if isinstance(url, str) and url]
+    urls = urls[:SOCIAL_STATE_MAX_URLS]
+
+    articles = attach_social_data([{"url": url} for url in urls], session.get('user_id'))
+
+    return jsonify({"items": {
+        a['url']: {
+            "likes": a['likes'],
+            "saves": a['saves'],
+            "liked": a['user_liked'],
+            "saved": a['user_saved']
+        }
+        for a in articles
+    }})
+
 # ---------- USER STATS ENDPOINT (NEW) ----------
 @app.route("/get_user_stats")
 def get_user_stats():
     if 'user_id' not in session:
         return jsonify({"saved_count": 0, "liked_count": 0})
     
-    db = get_db()
-    user_id_obj = ObjectId(session['user_id'])
-    
-    saved_count = db.saved_articles.count_documents({"user_id": user_id_obj})
-    liked_count = db.article_likes.count_documents({"user_id": user_id_obj})
-    
-    return jsonify({"saved_count": saved_count, "liked_count": liked_count})
+    return jsonify(get_user_counts(session['user_id']))
+
+
+# ---------- SCRAPING CLIENT ----------
+# One keep-alive session for all article fetches, so repeat hits on the same
+# news sites reuse warm TCP/TLS connections
+SCRAPE_TIMEOUT = float(os.environ.get("SCRAPE_TIMEOUT", 10))
+SCRAPE_PER_HOST = int(os.environ.get("SCRAPE_PER_HOST", 4))  # concurrent requests per site
+SCRAPE_HOST_POOLS = int(os.environ.get("SCRAPE_HOST_POOLS", 32))  # sites kept warm
+SCRAPE_MAX_BYTES = int(os.environ.get("SCRAPE_MAX_BYTES", 3 * 1024 * 1024))  # per page
+SCRAPE_CHUNK_SIZE = 64 * 1024
+HTML_CONTENT_TYPES = ("text/html", "application/xhtml+xml")
+
+SCRAPE_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+}
+
+def make_scrape_session():
+    retry = Retry(
+        total=2,
+        read=1,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "HEAD"]),
+        respect_retry_after_header=True,
+        raise_on_status=False
+    )
+    adapter = HTTPAdapter(
+        pool_connections=SCRAPE_HOST_POOLS,
+        pool_maxsize=SCRAPE_PER_HOST,
+        max_retries=retry
+    )
+    s = requests.Session()
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    s.headers.update(SCRAPE_HEADERS)
+    return s
+
+scrape_session = make_scrape_session()
+# host -> [semaphore, requests holding or waiting on it]. Entries are dropped when
+# the last user leaves, so arbitrary submitted URLs don't grow this forever.
+_host_slots = {}
+_host_slots_lock = threading.Lock()
+
+@contextmanager
+def host_slot(host):
+    """Caps concurrent requests to one host at SCRAPE_PER_HOST"""
+    with _host_slots_lock:
+        entry = _host_slots.get(host)
+        if entry is None:
+            entry = _host_slots[host] = [threading.BoundedSemaphore(SCRAPE_PER_HOST), 0]
+        entry[1] += 1
+    slot = entry[0]
+
+    try:
+        if not slot.acquire(timeout=SCRAPE_TIMEOUT):
+            raise TimeoutError(f"Too many concurrent requests to {host}")
+        try:
+            yield
+        finally:
+            slot.release()
+    finally:
+        with _host_slots_lock:
+            entry[1] -= 1
+            if entry[1] == 0:
+                del _host_slots[host]
+
+def download_page(url, max_paragraphs=None, headers=None, timeout=None):
+    """
+    Streams `url` through the shared scraping session straight into an HTML extractor.
+    Returns (response, page); page is None for 304 Not Modified.
+    Non-HTML content types are rejected before the body is read, at most
+    SCRAPE_MAX_BYTES are read, and the download stops as soon as the
+    extractor has `max_paragraphs` paragraphs.
+    """
+    host = urlparse(url).netloc.lower()
+    with host_slot(host):
+        response = scrape_session.get(url, headers=headers, timeout=timeout or SCRAPE_TIMEOUT, stream=True)
+        try:
+            if response.status_code == 304:
+                return response, None
+
+            content_type = response.headers.get("Content-Type", "").split(";")[0].strip().lower()
+            if content_type and content_type not in HTML_CONTENT_TYPES:
+                raise ValueError(f"Not an HTML page ({content_type})")
+
+            length = response.headers.get("Content-Length", "")
+            if length.isdigit() and int(length) > SCRAPE_MAX_BYTES:
+                raise ValueError(f"Page too large ({length} bytes)")
+
+            # Only trust an explicit charset; otherwise the parser sniffs <meta charset>
+            encoding = response.encoding if "charset" in response.headers.get("Content-Type", "").lower() else None
+            extractor = make_extractor(max_paragraphs=max_paragraphs, encoding=encoding)
+
+            received = 0
+            for chunk in response.iter_content(SCRAPE_CHUNK_SIZE):
+                received += len(chunk)
+                if received > SCRAPE_MAX_BYTES:
+                    print(f"Stopped reading {url} at {SCRAPE_MAX_BYTES} bytes")
+                    break
+                extractor.feed(chunk)
+                if extractor.done:
+                    break
+
+            return response, extractor.close()
+        finally:
+            # Early exits drop the connection instead of draining the rest of the body
+            response.close()
+
+# ---------- HTML EXTRACTION ----------
+# Pluggable engines that pull title, meta description, og:image and <p> texts
+# out of a page in one pass. "lxml" is used when installed; "html.parser" is
+# the BeautifulSoup reference engine.
+HTML_EXTRACTOR = os.environ.get("HTML_EXTRACTOR", "lxml" if lxml_etree is not None else "html.parser")
+
+def new_page():
+    return {"title": None, "description": "", "image_url": None, "paragraphs": []}
+
+class SoupExtractor:
+    """BeautifulSoup + html.parser: buffers the page and parses it on close()"""
+    def __init__(self, max_paragraphs=None, encoding=None):
+        self.max_paragraphs = max_paragraphs
+        self.encoding = encoding
+        self.done = False
+        self._chunks = []
+
+    def feed(self, data):
+        self._chunks.append(data.encode("utf-8") if isinstance(data, str) else data)
+
+    def close(self):
+        soup = BeautifulSoup(b"".join(self._chunks), 'html.parser', from_encoding=self.encoding)
+        page = new_page()
+
+        title_tag = soup.find('title')
+        if title_tag:
+            page["title"] = title_tag.get_text().strip()
+
+        meta_desc = soup.find('meta', attrs={'name': 'description'}) or \
+                    soup.find('meta', attrs={'property': 'og:description'})
+        if meta_desc:
+            page["description"] = meta_desc.get('content', '').strip()
+
+        img_tag = soup.find('meta', property='og:image')
+        if img_tag:
+            page["image_url"] = img_tag.get('content')
 
+        page["paragraphs"] = [p.get_text().strip() for p in soup.find_all('p', limit=self.max_paragraphs)]
+        return page
+
+class LxmlExtractor:
+    """
+    lxml incremental parser: only <title>, <meta> and <p> are surfaced, each
+    paragraph's text is read once, and parsing stops after max_paragraphs.
+    """
+    def __init__(self, max_paragraphs=None, encoding=None):
+        self.max_paragraphs = max_paragraphs
+        self.done = False
+        self._parser = lxml_etree.HTMLPullParser(events=("end",), tag=("title", "meta", "p"), encoding=encoding)
+        self._page = new_page()
+        self._og_description = None
+
+    def feed(self, data):
+        if self.done:
+            return
+        self._parser.feed(data)
+        self._consume()
+
+    def _consume(self):
+        page = self._page
+        for _, el in self._parser.read_events():
+            if self.done:
+                break
+            tag = el.tag
+            if tag == "p":
+                page["paragraphs"].append("".join(el.itertext()).strip())
+                el.clear()
+                if self.max_paragraphs and len(page["paragraphs"]) >= self.max_paragraphs:
+                    self.done = True
+            elif tag == "meta":
+                name = el.get("name")
+                prop = el.get("property")
+                if name == "description" and not page["description"]:
+                    page["description"] = (el.get("content") or "").strip()
+                elif prop == "og:description" and self._og_description is None:
+                    self._og_description = (el.get("content") or "").strip()
+                elif prop == "og:image" and page["image_url"] is None:
+                    page["image_url"] = el.get("content")
+            elif tag == "title" and page["title"] is None:
+                page["title"] = "".join(el.itertext()).strip()
+
+    def close(self):
+        if not self.done:
+            try:
+                self._parser.close()
+            except lxml_etree.LxmlError:
+                pass
+            self._consume()
+        if not self._page["description"] and self._og_description:
+            self._page["description"] = self._og_description
+        return self._page
+
+HTML_EXTRACTORS = {"html.parser": SoupExtractor}
+if lxml_etree is not None:
+    HTML_EXTRACTORS["lxml"] = LxmlExtractor
+
+def make_extractor(engine=None, max_paragraphs=None, encoding=None):
+    return HTML_EXTRACTORS[engine or HTML_EXTRACTOR](max_paragraphs=max_paragraphs, encoding=encoding)
+
+def extract_page(html, engine=None, max_paragraphs=None):
+    """Returns {"title", "description", "image_url", "paragraphs"} for a whole page"""
+    extractor = make_extractor(engine, max_paragraphs)
+    if html:
+        extractor.feed(html)
+    return extractor.close()
+
+# ---------- ARTICLE CACHE ----------
+# Stale-while-revalidate: entries older than ARTICLE_CACHE_FRESH are served as-is
+# and re-fetched in the background with If-None-Match / If-Modified-Since.
+ARTICLE_CACHE_FRESH = int(os.environ.get("ARTICLE_CACHE_FRESH", 3600))
+ARTICLE_CACHE_EXPIRE = int(os.environ.get("ARTICLE_CACHE_EXPIRE", 7 * 86400))  # TTL on last access
+ARTICLE_CACHE_MAX_DOCS = int(os.environ.get("ARTICLE_CACHE_MAX_DOCS", 5000))
+SCAN_PARAGRAPHS = 15  # paragraphs scored by the URL scanner
+
+refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="refresh")
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+def article_content(page):
+    """Returns (content, image_url) for the article reader from an extracted page"""
+    content = '\n\n'.join([text for text in page["paragraphs"] if len(text) > 50])
+    return content, page["image_url"]
+
+def scan_snapshot(page):
+    """
+    What /submit_fake_url scores, kept with the cached article so analyze_url can
+    reuse it: the page's own <title> and its first SCAN_PARAGRAPHS raw paragraphs
+    (the reader's `title` comes from the query string and `content` is filtered).
+    """
+    return {
+        "page_title": page["title"],
+        "scan_paragraphs": page["paragraphs"][:SCAN_PARAGRAPHS]
+    }
+
+def validators_from(response):
+    return {
+        "etag": response.headers.get("ETag"),
+        "last_modified": response.headers.get("Last-Modified")
+    }
+
+def is_article_stale(doc):
+    refreshed_at = doc.get("refreshed_at") or doc.get("cached_at")
+    if not refreshed_at:
+        return True
+    return (datetime.now() - refreshed_at).total_seconds() > ARTICLE_CACHE_FRESH
+
+def refresh_cached_article(url):
+    """Conditional re-fetch of one cached article (runs on refresh_executor)"""
+    try:
+        db = get_db()
+        doc = db.article_cache.find_one({"url": url})
+        if not doc:
+            return
+
+        headers = {}
+        if doc.get("etag"):
+            headers["If-None-Match"] = doc["etag"]
+        if doc.get("last_modified"):
+            headers["If-Modified-Since"] = doc["last_modified"]
+
+        response, page = download_page(url, headers=headers)
+        update = {"refreshed_at": datetime.now()}
+
+        if response.status_code == 200:
+            content, image_url = article_content(page)
+            if content:
+                update.update(validators_from(response))
+                update.update(scan_snapshot(page))
+                update.update({
+                    "content": content,
+                    "description": page["description"],
+                    "image_url": image_url,
+                    "category": detect_category(doc.get("title", ""), content[:500])
+                })
+        elif response.status_code != 304:
+            print(f"Article refresh got HTTP {response.status_code} for {url}")
+
+        # 304 / errors just restart the freshness window (backs off failing sites)
+        db.article_cache.update_one({"_id": doc["_id"]}, {"$set": update})
+    except Exception as e:
+        print(f"Article refresh error: {e}")
+    finally:
+        with _refreshing_lock:
+            _refreshing.discard(url)
+
+def schedule_article_refresh(url):
+    """Queues a background refresh unless one is already pending for this URL"""
+    with _refreshing_lock:
+        if url in _refreshing:
+            return
+        _refreshing.add(url)
+    refresh_executor.submit(refresh_cached_article, url)
+
+def evict_article_cache():
+    """LRU cap: drops the least recently read documents above ARTICLE_CACHE_MAX_DOCS"""
+    try:
+        db = get_db()
+        excess = db.article_cache.estimated_document_count() - ARTICLE_CACHE_MAX_DOCS
+        if excess <= 0:
+            return
+        coldest = [doc["_id"] for doc in db.article_cache.find({}, {"_id": 1}).sort("last_accessed", 1).limit(excess)]
+        db.article_cache.delete_many({"_id": {"$in": coldest}})
+    except Exception as e:
+        print(f"Article cache eviction error: {e}")
 
 # ---------- ARTICLE READER ----------
 @app.route("/read_article")
@@ -473,23 +1521,19 @@ def read_article():
         return redirect(url_for('dashboard'))
     
     db = get_db()
-    cached = db.article_cache.find_one({"url": url})
+
+    now = datetime.now()
+    # Read + LRU touch in one round-trip
+    cached = db.article_cache.find_one_and_update({"url": url}, {"$set": {"last_accessed": now}})
     
     if cached:
         article = cached
+        if is_article_stale(cached):
+            schedule_article_refresh(url)
     else:
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            paragraphs = soup.find_all('p')
-            content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 50])
-            
-            img_tag = soup.find('meta', property='og:image')
-            image_url = img_tag['content'] if img_tag else None
+            response, page = download_page(url)
+            content, image_url = article_content(page)
             
             category = detect_category(title, content[:500])
             
@@ -497,12 +1541,22 @@ def read_article():
                 "url": url,
                 "title": title,
                 "content": content,
+                "description": page["description"],
                 "image_url": image_url,
                 "category": category,
-                "cached_at": datetime.now()
+                "cached_at": now,
+                "refreshed_at": now,
+                "last_accessed": now
             }
+            article_doc.update(validators_from(response))
+            article_doc.update(scan_snapshot(page))
             
-            db.article_cache.insert_one(article_doc)
+            try:
+                db.article_cache.insert_one(article_doc)
+                refresh_executor.submit(evict_article_cache)
+            except DuplicateKeyError:
+                # A concurrent first read cached it already; keep one document per URL
+                article_doc = db.article_cache.find_one({"url": url}) or article_doc
             
             article = article_doc
             
@@ -514,6 +1568,133 @@ def read_article():
     
     return render_template('article_reader.html', article=article, username=session.get('username'))
 
+# ---------- URL SCAN CACHE ----------
+# Scan results per normalized URL, so a viral link is scraped and scored once per TTL
+URL_SCAN_TTL = int(os.environ.get("URL_SCAN_TTL", 6 * 3600))
+URL_SCAN_FIELDS = ("title", "description", "label", "confidence", "ai_score", "reasons")
+TRACKING_PARAMS = ("utm_", "fbclid", "gclid", "igshid", "mc_cid", "mc_eid")
+
+url_scan_cache = TTLCache(maxsize=1024, ttl=URL_SCAN_TTL)
+url_scan_flight = SingleFlight()
+
+def normalize_url(url):
+    """Lowercases scheme/host, drops default ports, fragments and tracking params, sorts the query"""
+    parts = urlsplit(url.strip())
+    scheme = (parts.scheme or "http").lower()
+    host = (parts.hostname or "").lower()
+    port = parts.port
+    if port and not (scheme == "http" and port == 80) and not (scheme == "https" and port == 443):
+        host = f"{host}:{port}"
+    path = parts.path or "/"
+    if len(path) > 1:
+        path = path.rstrip("/")
+    query = urlencode(sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.lower().startswith(TRACKING_PARAMS)
+    ))
+    return urlunsplit((scheme, host, path, query, ""))
+
+def analyze_url(url):
+    """Scrapes (or reuses the reader's scan_snapshot from article_cache) and scores a URL"""
+    db = get_db()
+    # Entries cached before the snapshot existed lack scan_paragraphs and are re-scraped
+    page = db.article_cache.find_one(
+        {"url": url, "scan_paragraphs": {"$exists": True}},
+        {"_id": 0, "page_title": 1, "description": 1, "scan_paragraphs": 1}
+    )
+
+    if page:
+        title = page.get("page_title") or "Unknown Title"
+        description = page.get("description") or ""
+        article_body = " ".join(page["scan_paragraphs"])
+    else:
+        _, page = download_page(url, max_paragraphs=SCAN_PARAGRAPHS)
+        
+        title = page["title"] or "Unknown Title"
+        description = page["description"]
+        article_body = " ".join(page["paragraphs"])
+    
+    full_text_to_analyze = f"{title}. {description}. {article_body}"
+    
+    label, confidence, ai_score, reasons = detect_fake_news_advanced(full_text_to_analyze, url)
+
+    return {
+        "title": title,
+        "description": description,
+        "label": label,
+        "confidence": confidence,
+        "ai_score": ai_score,
+        "reasons": reasons
+    }
+
+def scan_url(url):
+    """
+    Cached analyze_url(): in-memory tier, then the `url_scans` collection,
+    then a real scan (concurrent submissions of the same link share one scan).
+    """
+    key = normalize_url(url)
+    scan = url_scan_cache.get(key)
+    if scan is not None:
+        return scan
+
+    db = get_db()
+    doc = db.url_scans.find_one({
+        "url": key,
+        "scanned_at": {"$gte": datetime.fromtimestamp(time.time() - URL_SCAN_TTL)}
+    })
+    if doc:
+        scan = {field: doc.get(field) for field in URL_SCAN_FIELDS}
+        # Only for what is left of the stored scan's TTL
+        age = (datetime.now() - doc["scanned_at"]).total_seconds()
+        url_scan_cache.set(key, scan, ttl=max(URL_SCAN_TTL - age, 0))
+        return scan
+
+    def load():
+        result = analyze_url(url)
+        url_scan_cache.set(key, result)
+        db.url_scans.update_one(
+            {"url": key},
+            {"$set": dict(result, scanned_at=datetime.now())},
+            upsert=True
+        )
+        return result
+
+    return url_scan_flight.do(key, load, timeout=SCRAPE_TIMEOUT * 3)
+
+# ---------- FAKE NEWS SOURCES ----------
+# Per-domain aggregates are kept as running totals and updated with a single
+# atomic upsert, so concurrent reports for the same domain never lose a count.
+# avg_confidence is derived from total/count when the sources are read.
+def record_source_report(url, confidence):
+    try:
+        domain = urlparse(url).netloc or url
+    except Exception:
+        domain = url
+
+    db = get_db()
+    db.fake_news_sources.update_one(
+        {"domain": domain},
+        {
+            "$inc": {"report_count": 1, "total_confidence": confidence},
+            "$max": {"last_reported": datetime.now()},
+            "$setOnInsert": {"source_url": url, "is_blacklisted": 0}
+        },
+        upsert=True
+    )
+
+def find_sources(limit=None):
+    pipeline = [
+        {"$addFields": {"avg_confidence": {"$cond": [
+            {"$gt": ["$report_count", 0]},
+            {"$divide": ["$total_confidence", "$report_count"]},
+            0
+        ]}}},
+        {"$sort": {"report_count": -1, "avg_confidence": -1}}
+    ]
+    if limit:
+        pipeline.append({"$limit": limit})
+    return list(get_db().fake_news_sources.aggregate(pipeline))
+
 # ---------- SUBMIT FAKE URL ----------
 @app.route("/submit_fake_url", methods=["POST"])
 def submit_fake_url():
@@ -526,24 +1707,13 @@ def submit_fake_url():
         return jsonify({"status": "error", "message": "URL is required"}), 400
     
     try:
-        headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-        response = requests.get(url, headers=headers, timeout=10)
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        title = soup.find('title').get_text().strip() if soup.find('title') else "Unknown Title"
-        
-        meta_desc = soup.find('meta', attrs={'name': 'description'}) or \
-                    soup.find('meta', attrs={'property': 'og:description'})
-        description = meta_desc['content'].strip() if meta_desc else ""
-        
-        paragraphs = soup.find_all('p')
-        article_body = " ".join([p.get_text().strip() for p in paragraphs[:15]])
-        
-        full_text_to_analyze = f"{title}. {description}. {article_body}"
-        
-        label, confidence, ai_score, reasons = detect_fake_news_advanced(full_text_to_analyze, url)
+        # Repeat submissions of a link reuse its cached scan (no scraping / NLP)
+        scan = scan_url(url)
+        title = scan["title"]
+        label = scan["label"]
+        confidence = scan["confidence"]
+        ai_score = scan["ai_score"]
+        reasons = scan["reasons"]
         
         db = get_db()
         
@@ -560,42 +1730,8 @@ def submit_fake_url():
             "reported_at": datetime.now()
         })
         
-        try:
-            domain = urlparse(url).netloc
-        except:
-            domain = url
-        
         # Update Source
-        source = db.fake_news_sources.find_one({"domain": domain})
-        
-        if source:
-            # We need to calculate new average.
-            # Avg = (Total + New) / (Count + 1)
-            new_total = source.get('total_confidence', 0) + confidence
-            new_count = source.get('report_count', 0) + 1
-            new_avg = new_total / new_count
-            
-            db.fake_news_sources.update_one(
-                {"domain": domain},
-                {
-                    "$set": {
-                        "report_count": new_count,
-                        "total_confidence": new_total,
-                        "avg_confidence": new_avg,
-                        "last_reported": datetime.now()
-                    }
-                }
-            )
-        else:
-            db.fake_news_sources.insert_one({
-                "source_url": url,
-                "domain": domain,
-                "report_count": 1,
-                "total_confidence": confidence,
-                "avg_confidence": confidence,
-                "last_reported": datetime.now(),
-                "is_blacklisted": 0  # Default value
-            })
+        record_source_report(url, confidence)
         
         return jsonify({
             "status": "success",
@@ -694,20 +1830,16 @@ def get_personalized_news(user_id):
         query = ' OR '.join([f'({interest})' for interest in interests])
     
     try:
-        recommended = newsapi.get_everything(
+        recommended = fetch_news(
             q=query,
             language="en",
             sort_by="publishedAt",
             page_size=18
-        )["articles"]
+        )
         
         recommended = filter_philippine_news(recommended)[:9]
 
-        for article in recommended:
-            desc = article.get("description") or ""
-            article["summary"] = summarize(desc)
-            article["label"] = detect_fake_news(desc)
-            article["category"] = detect_category(article.get("title", ""), desc)
+        enrich_articles(recommended, translate=False)
 
         # ATTACH SOCIAL DATA
         recommended = attach_social_data(recommended, user_id)
@@ -716,28 +1848,243 @@ def get_personalized_news(user_id):
     except:
         return get_recommended_news()
 
+# ---------- READING HISTORY BUFFER ----------
+# History is written behind the request: reads are queued in memory and a
+# background thread flushes them in one bulk_write every HISTORY_FLUSH_INTERVAL
+# seconds, as soon as HISTORY_FLUSH_SIZE are pending, and at exit. Re-reads of
+# the same URL by the same user within HISTORY_DEDUPE_WINDOW of the first one
+# collapse into one document that gets the later read_at: a pending document is
+# updated in place, a flushed one is queued again under its _id and upserted.
+# The /history pages merge the user's pending reads in from memory.
+HISTORY_FLUSH_SIZE = int(os.environ.get("HISTORY_FLUSH_SIZE", 100))
+HISTORY_FLUSH_INTERVAL = float(os.environ.get("HISTORY_FLUSH_INTERVAL", 5))
+HISTORY_DEDUPE_WINDOW = int(os.environ.get("HISTORY_DEDUPE_WINDOW", 300))
+
+class HistoryBuffer:
+    def __init__(self, flush_size=100, interval=5, window=300):
+        self.flush_size = flush_size
+        self.interval = interval
+        self.window = window
+        self._pending = OrderedDict()  # (user_id, url) -> document
+        self._recent = {}              # (user_id, url) -> (monotonic time it was recorded, _id)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.added = 0
+        self.collapsed = 0
+        self.flushed = 0
+        self.failed = 0
+
+    def add(self, user_id, article_title, article_url):
+        key = (str(user_id), article_url)
+        now = time.monotonic()
+        with self._lock:
+            self.added += 1
+            doc = self._pending.get(key)
+            recorded_at, doc_id = self._recent.get(key, (float("-inf"), None))
+            if doc is None and now - recorded_at >= self.window:
+                doc_id = ObjectId()
+                self._recent[key] = (now, doc_id)
+            else:
+                self.collapsed += 1
+            # Either a new document or the (pending or already flushed) one being collapsed into
+            self._pending[key] = {
+                "_id": doc["_id"] if doc is not None else doc_id,
+                "user_id": ObjectId(user_id),
+                "article_title": article_title,
+                "article_url": article_url,
+                "read_at": datetime.now()
+            }
+            full = len(self._pending) >= self.flush_size
+
+        self.start()
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """Writes everything pending; returns the number of documents written"""
+        with self._flush_lock:
+            with self._lock:
+                docs = list(self._pending.values())
+                self._pending.clear()
+                cutoff = time.monotonic() - self.window
+                self._recent = {key: entry for key, entry in self._recent.items() if entry[0] >= cutoff}
+            if not docs:
+                return 0
+            try:
+                # Upserts by _id, so a re-read of a flushed document moves its read_at
+                get_db().reading_history.bulk_write([
+                    UpdateOne(
+                        {"_id": doc["_id"]},
+                        {"$set": {key: value for key, value in doc.items() if key != "_id"}},
+                        upsert=True
+                    )
+                    for doc in docs
+                ], ordered=False)
+                self.flushed += len(docs)
+                return len(docs)
+            except Exception as e:
+                self.failed += len(docs)
+                print(f"Reading history flush error: {e}")
+                return 0
+
+    def _run(self):
+        while True:
+            self._wakeup.wait(self.interval)
+            self._wakeup.clear()
+            self.flush()
+
+    def start(self):
+        """Starts the flusher thread (once per process)"""
+        if self._thread is None:
+            with self._lock:
+                if self._thread is None:
+                    self._thread = threading.Thread(target=self._run, daemon=True)
+                    self._thread.start()
+
+    def pending_for(self, user_id):
+        """Copies of `user_id`'s unflushed reads, newest first"""
+        user_id = str(user_id)
+        with self._lock:
+            docs = [dict(doc) for (uid, _), doc in self._pending.items() if uid == user_id]
+        return sorted(docs, key=lambda doc: doc["read_at"], reverse=True)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "pending": len(self._pending),
+                "added": self.added,
+                "collapsed": self.collapsed,
+                "flushed": self.flushed,
+                "failed": self.failed
+            }
+
+history_buffer = HistoryBuffer(HISTORY_FLUSH_SIZE, HISTORY_FLUSH_INTERVAL, HISTORY_DEDUPE_WINDOW)
+atexit.register(history_buffer.flush)
+
 def save_reading_history(user_id, article_title, article_url):
+    history_buffer.add(user_id, article_title, article_url)
+
+def with_pending_history(user_id, docs):
+    """Puts `user_id`'s buffered reads on top of the first history page, replacing stored copies"""
+    pending = history_buffer.pending_for(user_id)
+    if not pending:
+        return docs
+    pending_ids = {doc["_id"] for doc in pending}
+    return pending + [doc for doc in docs if doc["_id"] not in pending_ids]
+
+# ---------- READING HISTORY COMPACTION ----------
+# Only the newest HISTORY_RAW_LIMIT reads per user stay as raw documents (the
+# /history page shows 50). Older ones are rolled into one reading_history_daily
+# document per user and day ({user_id, day, read_count, article_urls, batches})
+# and deleted, so reading_history stays bounded however long a user has been around.
+HISTORY_RAW_LIMIT = int(os.environ.get("HISTORY_RAW_LIMIT", 200))
+HISTORY_COMPACT_INTERVAL = int(os.environ.get("HISTORY_COMPACT_INTERVAL", 3600))
+HISTORY_COMPACT_BATCH = 1000
+
+def apply_history_rollup(user_id, batch_id):
+    """Adds the reads tagged with `batch_id` to the daily aggregates (once) and deletes them; returns how many"""
     db = get_db()
-    db.reading_history.insert_one({
-        "user_id": ObjectId(user_id),
-        "article_title": article_title,
-        "article_url": article_url,
-        "read_at": datetime.now()
-    })
+    days = {}
+    for doc in db.reading_history.find({"rollup": batch_id}, {"article_url": 1, "read_at": 1}):
+        day = datetime.combine(doc["read_at"].date(), datetime.min.time())
+        entry = days.setdefault(day, [0, set()])
+        entry[0] += 1
+        if doc.get("article_url"):
+            entry[1].add(doc["article_url"])
+
+    # Days that already recorded this batch were applied by a run that died before the delete
+    done = set(db.reading_history_daily.distinct("day", {"user_id": user_id, "batches": batch_id}))
+    ops = [
+        UpdateOne(
+            {"user_id": user_id, "day": day},
+            {
+                "$inc": {"read_count": count},
+                "$addToSet": {"article_urls": {"$each": sorted(urls)}},
+                "$push": {"batches": batch_id}
+            },
+            upsert=True
+        )
+        for day, (count, urls) in days.items() if day not in done
+    ]
+    if ops:
+        db.reading_history_daily.bulk_write(ops, ordered=False)
+    db.reading_history.delete_many({"rollup": batch_id})
+    return sum(count for count, _ in days.values())
 
-def get_latest_news(user_id=None):
-    latest = newsapi.get_everything(
-        q='Philippines OR Manila OR Cebu OR Davao OR Duterte OR Marcos OR Philippine',
-        language="en",
-        sort_by="publishedAt",
-        page_size=12
-    )["articles"]
-    
-    latest = filter_philippine_news(latest)[:6]
+def compact_user_history(user_id, keep=None):
+    """Rolls a user's reads beyond the newest `keep` into daily aggregates; returns how many were rolled up"""
+    db = get_db()
+    keep = HISTORY_RAW_LIMIT if keep is None else keep
+
+    # Each batch is tagged before it is counted, so a crash between the $inc and
+    # the delete leaves it tagged and it is finished here without counting it twice
+    rolled = 0
+    for batch_id in db.reading_history.distinct("rollup", {"user_id": user_id, "rollup": {"$exists": True}}):
+        rolled += apply_history_rollup(user_id, batch_id)
+
+    old = db.reading_history.find(
+        {"user_id": user_id},
+        {"_id": 1}
+    ).sort([("read_at", -1), ("_id", -1)]).skip(keep)
+
+    batch = list(itertools.islice(old, HISTORY_COMPACT_BATCH))
+    while batch:
+        batch_id = ObjectId()
+        db.reading_history.update_many(
+            {"_id": {"$in": [doc["_id"] for doc in batch]}},
+            {"$set": {"rollup": batch_id}}
+        )
+        rolled += apply_history_rollup(user_id, batch_id)
+        batch = list(itertools.islice(old, HISTORY_COMPACT_BATCH))
+
+    return rolled
+
+def compact_reading_history():
+    """One compaction pass over every user above the raw limit; returns the number of reads rolled up"""
+    # Flush first so the buffered reads count towards the window
+    history_buffer.flush()
 
-    for article in latest:
-        desc = article.get("description") or ""
-        article["summary"] = summarize(desc)
+    over_limit = get_db().reading_history.aggregate([
+        {"$group": {"_id": "$user_id", "count": {"$sum": 1}}},
+        {"$match": {"count": {"$gt": HISTORY_RAW_LIMIT}}}
+    ], allowDiskUse=True)
+
+    rolled = 0
+    for item in over_limit:
+        try:
+            rolled += compact_user_history(item["_id"])
+        except Exception as e:
+            print(f"History compaction error for {item['_id']}: {e}")
+    return rolled
+
+_compaction_thread = None
+
+def compaction_worker():
+    while True:
+        time.sleep(HISTORY_COMPACT_INTERVAL)
+        try:
+            count = compact_reading_history()
+            print(f"Rolled up {count} reading history entries")
+        except Exception as e:
+            print(f"Compaction worker error: {e}")
+
+def start_compaction_worker():
+    """Starts the background history compaction thread (once per process)"""
+    global _compaction_thread
+    if _compaction_thread is None:
+        _compaction_thread = threading.Thread(target=compaction_worker, daemon=True)
+        _compaction_thread.start()
+    return _compaction_thread
+
+@app.cli.command("compact-history")
+def compact_history_command():
+    """Roll old reading history into daily aggregates (e.g. from cron)"""
+    print(f"Rolled up {compact_reading_history()} reading history entries")
+
+def get_latest_news(user_id=None):
+    latest = get_feed_articles("latest", 6)
 
     # ATTACH SOCIAL DATA
     latest = attach_social_data(latest, user_id)
@@ -745,26 +2092,279 @@ def get_latest_news(user_id=None):
     return latest
 
 def get_recommended_news(user_id=None):
-    topics = '(Philippines OR Manila OR Cebu OR Davao OR Mindanao OR Luzon OR Visayas OR "Philippine government" OR "Filipino" OR Quezon OR Makati OR Pasig)'
-
-    recommended = newsapi.get_everything(
-        q=topics,
-        language="en",
-        sort_by="publishedAt",
-        page_size=12
-    )["articles"]
-    
-    recommended = filter_philippine_news(recommended)[:6]
-
-    for article in recommended:
-        desc = article.get("description") or ""
-        article["summary"] = summarize(desc)
+    recommended = get_feed_articles("recommended", 6)
     
     # ATTACH SOCIAL DATA
     recommended = attach_social_data(recommended, user_id)
 
     return recommended
 
+# ---------- NEWS INGESTION ----------
+INGEST_INTERVAL = int(os.environ.get("INGEST_INTERVAL", 600))  # seconds between polls
+INGEST_RETENTION_DAYS = int(os.environ.get("INGEST_RETENTION_DAYS", 7))
+
+def ingest_news():
+    """
+    Polls every feed in NEWS_FEEDS once and upserts the results into `articles`.
+    Articles are deduped by URL and only enriched the first time they are seen.
+    Returns the number of newly stored articles.
+    """
+    db = get_db()
+    now = datetime.now()
+    inserted = 0
+
+    for feed, params in NEWS_FEEDS.items():
+        try:
+            raw = fetch_news(
+                q=params["q"],
+                language="en",
+                sort_by="publishedAt",
+                page_size=params["page_size"]
+            )
+        except Exception as e:
+            print(f"Ingestion error ({feed}): {e}")
+            continue
+
+        articles = {}
+        for article in filter_philippine_news(raw):
+            if article.get("url"):
+                articles.setdefault(article["url"], article)
+
+        if not articles:
+            continue
+
+        existing = set(doc["url"] for doc in db.articles.find(
+            {"url": {"$in": list(articles)}},
+            {"url": 1}
+        ))
+
+        if existing:
+            db.articles.update_many(
+                {"url": {"$in": list(existing)}},
+                {"$addToSet": {"feeds": feed}, "$set": {"last_seen": now}}
+            )
+
+        new_articles = [a for url, a in articles.items() if url not in existing]
+        # Off the request path, so translations get a generous deadline
+        enrich_articles(new_articles, translate_timeout=60)
+
+        for article in new_articles:
+            url = article["url"]
+            article.pop("feeds", None)
+            result = db.articles.update_one(
+                {"url": url},
+                {
+                    "$setOnInsert": dict(article, ingested_at=now),
+                    "$addToSet": {"feeds": feed},
+                    "$set": {"last_seen": now}
+                },
+                upsert=True
+            )
+            if result.upserted_id is not None:
+                inserted += 1
+
+    # Drop articles that no feed has returned for a while
+    cutoff = datetime.fromtimestamp(now.timestamp() - INGEST_RETENTION_DAYS * 86400)
+    db.articles.delete_many({"last_seen": {"$lt": cutoff}})
+
+    return inserted
+
+def get_feed_articles(feed, limit):
+    """
+    Reads a feed from the local `articles` collection (newest first).
+    Falls back to a live NewsAPI fetch when the worker hasn't filled it yet.
+    """
+    db = get_db()
+    try:
+        articles = list(db.articles.find(
+            {"feeds": feed},
+            {"_id": 0, "feeds": 0, "ingested_at": 0, "last_seen": 0}
+        ).sort("publishedAt", -1).limit(limit))
+    except Exception as e:
+        print(f"Articles read error ({feed}): {e}")
+        articles = []
+
+    if articles:
+        return articles
+
+    params = NEWS_FEEDS[feed]
+    articles = fetch_news(
+        q=params["q"],
+        language="en",
+        sort_by="publishedAt",
+        page_size=params["page_size"]
+    )
+    articles = filter_philippine_news(articles)[:limit]
+
+    enrich_articles(articles, translate=False)
+
+    return articles
+
+_ingestion_thread = None
+
+def ingestion_worker():
+    while True:
+        try:
+            count = ingest_news()
+            print(f"Ingested {count} new articles")
+        except Exception as e:
+            print(f"Ingestion worker error: {e}")
+        time.sleep(INGEST_INTERVAL)
+
+def start_ingestion_worker():
+    """Starts the background ingestion thread (once per process)"""
+    global _ingestion_thread
+    if _ingestion_thread is None:
+        _ingestion_thread = threading.Thread(target=ingestion_worker, daemon=True)
+        _ingestion_thread.start()
+    return _ingestion_thread
+
+@app.cli.command("ingest-news")
+def ingest_news_command():
+    """Run one ingestion pass (e.g. from cron)"""
+    print(f"Ingested {ingest_news()} new articles")
+
+# ---------- DATABASE INDEXES ----------
+# (collection, keys, options). create_index is a no-op when the index already
+# exists, so this is safe to run on every start. Unique indexes back the
+# "one per user/url" assumptions the routes make with find_one + insert_one.
+INDEX_SPECS = [
+    ("users", [("email", ASCENDING)], {"unique": True}),
+    ("users", [("username", ASCENDING)], {"unique": True}),
+    ("user_preferences", [("user_id", ASCENDING)], {"unique": True}),
+    ("article_likes", [("user_id", ASCENDING), ("article_url", ASCENDING)], {"unique": True}),
+    ("article_likes", [("article_url", ASCENDING)], {}),
+    ("article_stats", [("url", ASCENDING)], {"unique": True}),
+    ("saved_articles", [("user_id", ASCENDING), ("url", ASCENDING)], {"unique": True}),
+    ("saved_articles", [("user_id", ASCENDING), ("saved_at", DESCENDING), ("_id", DESCENDING)], {}),
+    ("saved_articles", [("url", ASCENDING)], {}),
+    ("reading_history", [("user_id", ASCENDING), ("read_at", DESCENDING), ("_id", DESCENDING)], {}),
+    ("reading_history_daily", [("user_id", ASCENDING), ("day", DESCENDING)], {"unique": True}),
+    ("fake_news_reports", [("user_id", ASCENDING), ("reported_at", DESCENDING), ("_id", DESCENDING)], {}),
+    ("fake_news_sources", [("domain", ASCENDING)], {"unique": True}),
+    # avg_confidence is derived on read (see find_sources), so only the count is indexable
+    ("fake_news_sources", [("report_count", DESCENDING)], {}),
+    ("chatbot_conversations", [("user_id", ASCENDING), ("created_at", DESCENDING)], {}),
+    ("article_cache", [("url", ASCENDING)], {"unique": True}),
+    ("article_cache", [("last_accessed", ASCENDING)], {"expireAfterSeconds": ARTICLE_CACHE_EXPIRE}),
+    ("articles", [("url", ASCENDING)], {"unique": True}),
+    ("articles", [("feeds", ASCENDING), ("publishedAt", DESCENDING)], {}),
+    ("articles", [("last_seen", ASCENDING)], {}),
+    ("translations", [("text_hash", ASCENDING), ("target", ASCENDING)], {"unique": True}),
+    ("article_enrichment", [("url", ASCENDING), ("desc_hash", ASCENDING)], {"unique": True}),
+    ("article_enrichment", [("updated_at", ASCENDING)], {"expireAfterSeconds": ENRICH_CACHE_TTL}),
+    ("url_scans", [("url", ASCENDING)], {"unique": True}),
+    ("url_scans", [("scanned_at", ASCENDING)], {"expireAfterSeconds": URL_SCAN_TTL}),
+]
+
+# (name, collection, filter, sort) for the queries behind the busiest pages,
+# run through explain() by `flask ensure-indexes --check`
+HOT_QUERIES = [
+    ("login", "users", {"email": "user@example.com"}, None),
+    ("toggle_like", "article_likes", {"user_id": ObjectId(), "article_url": "https://example.com"}, None),
+    ("social_counts", "article_stats", {"url": {"$in": ["https://example.com"]}}, None),
+    ("toggle_save", "saved_articles", {"user_id": ObjectId(), "url": "https://example.com"}, None),
+    ("saved", "saved_articles", {"user_id": ObjectId()}, [("saved_at", DESCENDING), ("_id", DESCENDING)]),
+    ("history", "reading_history", {"user_id": ObjectId()}, [("read_at", DESCENDING), ("_id", DESCENDING)]),
+    ("tracker", "fake_news_reports", {"user_id": ObjectId()}, [("reported_at", DESCENDING), ("_id", DESCENDING)]),
+    ("report_source", "fake_news_sources", {"domain": "example.com"}, None),
+    ("chatbot", "chatbot_conversations", {"user_id": ObjectId()}, [("created_at", DESCENDING)]),
+    ("read_article", "article_cache", {"url": "https://example.com"}, None),
+    ("feed", "articles", {"feeds": "latest"}, [("publishedAt", DESCENDING)]),
+    ("translation", "translations", {"text_hash": "0", "target": "tl"}, None),
+    ("url_scan", "url_scans", {"url": "https://example.com"}, None),
+]
+
+INDEX_OPTIONS_CONFLICT = (85, 86)  # IndexOptionsConflict, IndexKeySpecsConflict
+
+def sync_index(collection, keys, options):
+    """
+    create_index, but an existing index on the same keys with other options is
+    brought in line: a changed TTL via collMod, anything else by drop + recreate.
+    """
+    try:
+        collection.create_index(keys, **options)
+        return
+    except OperationFailure as e:
+        if e.code not in INDEX_OPTIONS_CONFLICT:
+            raise
+
+    if set(options) == {"expireAfterSeconds"}:
+        collection.database.command(
+            "collMod", collection.name,
+            index={"keyPattern": dict(keys), "expireAfterSeconds": options["expireAfterSeconds"]}
+        )
+        return
+
+    for name, info in collection.index_information().items():
+        if list(info["key"]) == list(keys):
+            collection.drop_index(name)
+    try:
+        collection.create_index(keys, **options)
+    except Exception:
+        # Keep the lookups indexed even if e.g. duplicates block the unique version
+        collection.create_index(keys)
+        raise
+
+def ensure_indexes(collections=None):
+    """Creates the indexes in INDEX_SPECS (optionally only for `collections`); returns how many failed"""
+    db = get_db()
+    failed = 0
+    for collection, keys, options in INDEX_SPECS:
+        if collections and collection not in collections:
+            continue
+        try:
+            sync_index(db[collection], keys, options)
+        except Exception as e:
+            # e.g. existing duplicates block a unique index; the app still works without it
+            print(f"Index error on {collection} {keys}: {e}")
+            failed += 1
+    return failed
+
+def plan_stages(plan):
+    """Yields every stage name in an explain() plan tree"""
+    if isinstance(plan, dict):
+        if "stage" in plan:
+            yield plan["stage"]
+        for value in plan.values():
+            yield from plan_stages(value)
+    elif isinstance(plan, list):
+        for value in plan:
+            yield from plan_stages(value)
+
+def check_indexes():
+    """Runs explain() on HOT_QUERIES; returns the names of those whose winning plan is a COLLSCAN"""
+    db = get_db()
+    scans = []
+    for name, collection, query, sort in HOT_QUERIES:
+        cursor = db[collection].find(query).limit(20)
+        if sort:
+            cursor = cursor.sort(sort)
+        try:
+            plan = cursor.explain().get("queryPlanner", {}).get("winningPlan", {})
+        except Exception as e:
+            print(f"{name:15s} explain error: {e}")
+            scans.append(name)
+            continue
+        stages = set(plan_stages(plan))
+        status = "COLLSCAN" if "COLLSCAN" in stages else "ok"
+        print(f"{name:15s} {collection:22s} {status:9s} {' > '.join(sorted(stages))}")
+        if status != "ok":
+            scans.append(name)
+    return scans
+
+@app.cli.command("ensure-indexes")
+@click.option("--check", is_flag=True, help="Only explain() the hot queries and report collection scans")
+def ensure_indexes_command(check):
+    """Create missing MongoDB indexes (idempotent)"""
+    if check:
+        scans = check_indexes()
+        if scans:
+            raise SystemExit(f"Collection scans: {', '.join(scans)}")
+        return
+    failed = ensure_indexes()
+    print(f"Indexes ensured ({failed} failed)")
+
 # ---------- AUTHENTICATION ----------
 @app.route("/register", methods=["GET", "POST"])
 def register():
@@ -784,13 +2384,19 @@ def register():
         
         hashed_password = generate_password_hash(password)
         
-        result = db.users.insert_one({
-            "username": username,
-            "email": email,
-            "password": hashed_password,
-            "created_at": datetime.now(),
-            "is_admin": 0 
-        })
+        try:
+            result = db.users.insert_one({
+                "username": username,
+                "email": email,
+                "password": hashed_password,
+                "created_at": datetime.now(),
+                "is_admin": 0,
+                "liked_count": 0,
+                "saved_count": 0
+            })
+        except DuplicateKeyError:
+            flash("User already exists!", "danger")
+            return redirect(url_for('register'))
         
         user_id = result.inserted_id
         
@@ -834,73 +2440,95 @@ def logout():
 @app.route("/")
 def landing():
     if 'user_id' not in session:
-        latest_news = get_latest_news()
-        
-        headlines = newsapi.get_everything(
-            q='Philippines OR Manila OR "Philippine news" OR Duterte OR Marcos',
-            language="en",
-            sort_by="publishedAt",
-            page_size=12
-        )["articles"]
-        
-        headlines = filter_philippine_news(headlines)[:6]
-        
-        for h in headlines:
-            desc = h.get("description") or ""
-            h["label"] = detect_fake_news(desc)
-        
-        # ATTACH SOCIAL DATA (No user ID, so just global counts)
-        headlines = attach_social_data(headlines)
+        results = run_parallel({
+            "latest_news": get_latest_news,
+            # ATTACH SOCIAL DATA (No user ID, so just global counts)
+            "headlines": lambda: attach_social_data(get_feed_articles("landing_headlines", 6))
+        }, defaults={"latest_news": [], "headlines": []})
 
         return render_template(
             "landing.html",
-            all_headlines=headlines,
-            latest_news=latest_news
+            all_headlines=results["headlines"],
+            latest_news=results["latest_news"]
         )
     
     return redirect(url_for('dashboard'))
 
 # ---------- DASHBOARD (PAGINATION) ----------
+def search_news(keyword):
+    search_query = f'({keyword}) AND (Philippines OR Manila OR Filipino OR "Philippine news")'
+
+    raw_news = fetch_news(
+        q=search_query,
+        language="en",
+        sort_by="relevancy",
+        page_size=50
+    )
+    
+    articles = filter_philippine_news(raw_news)
+    
+    # One batch: cache misses are scored together on the process pool
+    return enrich_articles(articles)
+
+def get_category_headlines(category):
+    # Define keywords for each category
+    category_keywords = {
+        'Politics': 'politics OR government OR election OR senate OR congress',
+        'Business': 'business OR economy OR market OR trade',
+        'Technology': 'technology OR tech OR digital OR cyber',
+        'Sports': 'sports OR basketball OR PBA OR boxing',
+        'Entertainment': 'entertainment OR showbiz OR celebrity',
+        'Health': 'health OR covid OR medical OR virus',
+        'World': 'world news',
+    }
+    
+    # Get keywords for selected category, default to general if not found
+    keywords = category_keywords.get(category, category)
+    
+    # Construct query combining category keywords with Philippines context
+    if category == 'World':
+         query = f'({keywords})' # World news might not always have "Philippines" in text
+    else:
+         query = f'({keywords}) AND (Philippines OR Manila)'
+
+    headlines = fetch_news(
+        q=query,
+        language="en",
+        sort_by="publishedAt",
+        page_size=18
+    )
+
+    headlines = filter_philippine_news(headlines)[:9]
+    enrich_articles(headlines, translate=False)
+
+    return headlines
+
 @app.route("/dashboard", methods=["GET", "POST"])
 def dashboard():
     if 'user_id' not in session:
         return redirect(url_for('landing'))
     
     user_id = session['user_id']
-    recommended = get_personalized_news(user_id)
-    prefs = get_user_preferences(user_id) # Added to fix undefined prefs error
 
     page = request.args.get('page', 1, type=int)
     category = request.args.get('category')  # Handle category filter
     per_page = 9
     
-    all_articles = []
-    latest_news = []
-    total_pages = 0
+    # Independent fetches run concurrently; total latency ~ the slowest one
+    tasks = {
+        "recommended": lambda: get_personalized_news(user_id),
+        "prefs": lambda: get_user_preferences(user_id)  # Added to fix undefined prefs error
+    }
+    defaults = {"recommended": [], "articles": [], "headlines": [], "latest_news": []}
 
     if request.method == "POST":
         keyword = request.form.get("keyword")
 
-        search_query = f'({keyword}) AND (Philippines OR Manila OR Filipino OR "Philippine news")'
-
-        raw_news = newsapi.get_everything(
-            q=search_query,
-            language="en",
-            sort_by="relevancy",
-            page_size=50
-        )["articles"]
-        
-        all_articles = filter_philippine_news(raw_news)
-        
-        for article in all_articles:
-            desc = article.get("description") or ""
-            article["label"] = detect_fake_news(desc)
-            article["summary"] = summarize(desc)
-            article["filipino"] = translate_filipino(desc)
-            article["category"] = detect_category(article.get("title", ""), desc)
-
         # ATTACH SOCIAL DATA
-        all_articles = attach_social_data(all_articles, user_id)
+        tasks["articles"] = lambda: attach_social_data(search_news(keyword), user_id)
+        results = run_parallel(tasks, defaults=defaults)
+
+        all_articles = results["articles"]
 
         total_items = len(all_articles)
         total_pages = (total_items + per_page - 1) // per_page
@@ -914,76 +2542,26 @@ def dashboard():
             all_articles=paginated_articles,
             keyword=keyword,
             latest_news=[],
-            recommended_news=recommended,
+            recommended_news=results["recommended"],
             username=session.get('username'),
             page=page,
             total_pages=total_pages,
-            prefs=prefs  # Pass prefs to template
+            prefs=results["prefs"]  # Pass prefs to template
         )
 
     # GET MODE
     if category:
-        # Define keywords for each category
-        category_keywords = {
-            'Politics': 'politics OR government OR election OR senate OR congress',
-            'Business': 'business OR economy OR market OR trade',
-            'Technology': 'technology OR tech OR digital OR cyber',
-            'Sports': 'sports OR basketball OR PBA OR boxing',
-            'Entertainment': 'entertainment OR showbiz OR celebrity',
-            'Health': 'health OR covid OR medical OR virus',
-            'World': 'world news',
-        }
-        
-        # Get keywords for selected category, default to general if not found
-        keywords = category_keywords.get(category, category)
-        
-        # Construct query combining category keywords with Philippines context
-        if category == 'World':
-             query = f'({keywords})' # World news might not always have "Philippines" in text
-        else:
-             query = f'({keywords}) AND (Philippines OR Manila)'
-
-        headlines = newsapi.get_everything(
-            q=query,
-            language="en",
-            sort_by="publishedAt",
-            page_size=18
-        )["articles"]
+        load_headlines = lambda: get_category_headlines(category)
     else:
-        # Default Headlines if no category selected
-        headlines = newsapi.get_everything(
-            q='Philippines OR Manila OR "Philippine news" OR "Metro Manila" OR Cebu OR Davao',
-            language="en",
-            sort_by="publishedAt",
-            page_size=18 
-        )["articles"]
-
-    headlines = filter_philippine_news(headlines)[:9]
-    for h in headlines:
-        desc = h.get("description") or ""
-        h["label"] = detect_fake_news(desc)
-        h["category"] = detect_category(h.get("title", ""), desc)
+        # Default Headlines if no category selected (pre-ingested)
+        load_headlines = lambda: get_feed_articles("dashboard_headlines", 9)
     
     # ATTACH SOCIAL DATA
-    headlines = attach_social_data(headlines, user_id)
-
-    raw_latest = newsapi.get_everything(
-        q='Philippines OR Manila OR Cebu OR Davao OR Duterte OR Marcos OR Philippine',
-        language="en",
-        sort_by="publishedAt",
-        page_size=50
-    )["articles"]
-    
-    latest_news = filter_philippine_news(raw_latest)
+    tasks["headlines"] = lambda: attach_social_data(load_headlines(), user_id)
+    tasks["latest_news"] = lambda: attach_social_data(get_feed_articles("latest", 50), user_id)
+    results = run_parallel(tasks, defaults=defaults)
 
-    for article in latest_news:
-        desc = article.get("description") or ""
-        article["summary"] = summarize(desc)
-        article["label"] = detect_fake_news(desc)
-        article["category"] = detect_category(article.get("title", ""), desc)
-
-    # ATTACH SOCIAL DATA
-    latest_news = attach_social_data(latest_news, user_id)
+    latest_news = results["latest_news"]
 
     total_items = len(latest_news)
     total_pages = (total_items + per_page - 1) // per_page
@@ -994,13 +2572,13 @@ def dashboard():
 
     return render_template(
         "home.html",
-        all_headlines=headlines,
+        all_headlines=results["headlines"],
         latest_news=paginated_latest,
-        recommended_news=recommended,
+        recommended_news=results["recommended"],
         username=session.get('username'),
         page=page,
         total_pages=total_pages,
-        prefs=prefs  # Pass prefs to template
+        prefs=results["prefs"]  # Pass prefs to template
     )
 
 @app.route("/preferences", methods=["GET", "POST"])
@@ -1055,26 +2633,100 @@ def save_article():
     if existing:
         return jsonify({"status": "info", "message": "Already saved!"})
 
-    db.saved_articles.insert_one({
-        "user_id": ObjectId(session['user_id']),
-        "title": title,
-        "url": url,
-        "saved_at": datetime.now()
-    })
+    try:
+        db.saved_articles.insert_one({
+            "user_id": ObjectId(session['user_id']),
+            "title": title,
+            "url": url,
+            "saved_at": datetime.now()
+        })
+    except DuplicateKeyError:
+        return jsonify({"status": "info", "message": "Already saved!"})
+    bump_article_stats(url, saves=1)
+    bump_user_stats(session['user_id'], saves=1)
 
     return jsonify({"status": "success", "message": "Saved!"})
 
+# ---------- PAGINATION ----------
+# Keyset pagination over (sort field, _id), newest first. The cursor is the
+# last row's "<isoformat>_<ObjectId>", so each page is one index range scan
+# no matter how deep the user scrolls.
+PAGE_SIZE = int(os.environ.get("PAGE_SIZE", 20))
+MAX_PAGE_SIZE = 100
+
+def encode_cursor(doc, field):
+    value = doc.get(field)
+    if not isinstance(value, datetime):
+        return None
+    return f"{value.isoformat()}_{doc['_id']}"
+
+def decode_cursor(cursor):
+    """Returns (datetime, ObjectId) or None for a missing / malformed cursor"""
+    try:
+        value, _, oid = (cursor or "").rpartition("_")
+        return datetime.fromisoformat(value), ObjectId(oid)
+    except Exception:
+        return None
+
+def page_limit(value, default=None):
+    try:
+        return max(1, min(int(value), MAX_PAGE_SIZE))
+    except (TypeError, ValueError):
+        return default or PAGE_SIZE
+
+def paginate(collection, query, field, cursor=None, limit=None):
+    """Returns (docs, next_cursor) for one page of `collection` sorted by `field` desc, `_id` desc"""
+    limit = limit or PAGE_SIZE
+    position = decode_cursor(cursor)
+    if position:
+        value, oid = position
+        query = {"$and": [query, {"$or": [
+            {field: {"$lt": value}},
+            {field: value, "_id": {"$lt": oid}}
+        ]}]}
+
+    docs = list(get_db()[collection].find(query).sort([(field, -1), ("_id", -1)]).limit(limit + 1))
+    next_cursor = encode_cursor(docs[limit - 1], field) if len(docs) > limit else None
+    return docs[:limit], next_cursor
+
+def page_json(docs, next_cursor):
+    """JSON body for the infinite-scroll endpoints"""
+    items = []
+    for doc in docs:
+        item = {}
+        for key, value in doc.items():
+            if key == "user_id":
+                continue
+            if isinstance(value, ObjectId):
+                value = str(value)
+            elif isinstance(value, datetime):
+                value = value.isoformat()
+            item["id" if key == "_id" else key] = value
+        items.append(item)
+    return jsonify({"items": items, "next_cursor": next_cursor})
+
 @app.route("/saved")
 def saved():
     if 'user_id' not in session:
         return redirect(url_for('landing'))
     
-    db = get_db()
-    articles = list(db.saved_articles.find(
-        {"user_id": ObjectId(session['user_id'])}
-    ).sort("saved_at", -1))
+    articles, next_cursor = paginate(
+        "saved_articles", {"user_id": ObjectId(session['user_id'])}, "saved_at",
+        cursor=request.args.get('cursor')
+    )
     
-    return render_template("saved.html", articles=articles, username=session.get('username'))
+    return render_template("saved.html", articles=articles, next_cursor=next_cursor, username=session.get('username'))
+
+@app.route("/api/saved")
+def api_saved():
+    if 'user_id' not in session:
+        return jsonify({"status": "error", "message": "Not logged in"}), 401
+
+    articles, next_cursor = paginate(
+        "saved_articles", {"user_id": ObjectId(session['user_id'])}, "saved_at",
+        cursor=request.args.get('cursor'), limit=page_limit(request.args.get('limit'))
+    )
+    return page_json(articles, next_cursor)
 
 @app.route("/delete_saved", methods=["POST"])
 def delete_saved():
@@ -1084,12 +2736,14 @@ def delete_saved():
     article_id = request.json.get('article_id')
     
     db = get_db()
-    result = db.saved_articles.delete_one({
-        "_id": ObjectId(article_id),
-        "user_id": ObjectId(session['user_id'])
-    })
+    deleted = db.saved_articles.find_one_and_delete(
+        {"_id": ObjectId(article_id), "user_id": ObjectId(session['user_id'])},
+        projection={"url": 1}
+    )
     
-    if result.deleted_count > 0:
+    if deleted:
+        bump_article_stats(deleted.get('url'), saves=-1)
+        bump_user_stats(session['user_id'], saves=-1)
         return jsonify({"status": "success", "message": "Article removed"})
     else:
         return jsonify({"status": "error", "message": "Article not found"}), 404
@@ -1099,12 +2753,27 @@ def history():
     if 'user_id' not in session:
         return redirect(url_for('landing'))
     
-    db = get_db()
-    history = list(db.reading_history.find(
-        {"user_id": ObjectId(session['user_id'])}
-    ).sort("read_at", -1).limit(50))
+    history, next_cursor = paginate(
+        "reading_history", {"user_id": ObjectId(session['user_id'])}, "read_at",
+        cursor=request.args.get('cursor'), limit=50
+    )
+    if not request.args.get('cursor'):
+        history = with_pending_history(session['user_id'], history)
     
-    return render_template("history.html", history=history, username=session.get('username'))
+    return render_template("history.html", history=history, next_cursor=next_cursor, username=session.get('username'))
+
+@app.route("/api/history")
+def api_history():
+    if 'user_id' not in session:
+        return jsonify({"status": "error", "message": "Not logged in"}), 401
+
+    history, next_cursor = paginate(
+        "reading_history", {"user_id": ObjectId(session['user_id'])}, "read_at",
+        cursor=request.args.get('cursor'), limit=page_limit(request.args.get('limit'))
+    )
+    if not request.args.get('cursor'):
+        history = with_pending_history(session['user_id'], history)
+    return page_json(history, next_cursor)
 
 @app.route("/track_read", methods=["POST"])
 def track_read():
@@ -1143,40 +2812,7 @@ def report_fake():
         "reported_at": datetime.now()
     })
     
-    from urllib.parse import urlparse
-    try:
-        domain = urlparse(article_url).netloc
-    except:
-        domain = article_url
-    
-    source = db.fake_news_sources.find_one({"domain": domain})
-    
-    if source:
-        new_total = source.get('total_confidence', 0) + confidence
-        new_count = source.get('report_count', 0) + 1
-        new_avg = new_total / new_count
-        
-        db.fake_news_sources.update_one(
-            {"domain": domain},
-            {
-                "$set": {
-                    "report_count": new_count,
-                    "total_confidence": new_total,
-                    "avg_confidence": new_avg,
-                    "last_reported": datetime.now()
-                }
-            }
-        )
-    else:
-        db.fake_news_sources.insert_one({
-            "source_url": article_url,
-            "domain": domain,
-            "report_count": 1,
-            "total_confidence": confidence,
-            "avg_confidence": confidence,
-            "last_reported": datetime.now(),
-            "is_blacklisted": 0
-        })
+    record_source_report(article_url, confidence)
     
     return jsonify({
         "status": "success",
@@ -1200,16 +2836,14 @@ def fake_news_tracker():
     # 3. GET USER'S HISTORY (The Fix)
     # We add {"user_id": user_id_obj} to the find() query.
     # This ensures we only fetch reports created by this specific account.
-    recent_reports = list(db.fake_news_reports.find(
-        {"user_id": user_id_obj} 
-    ).sort("reported_at", -1).limit(50))
+    recent_reports, next_cursor = paginate(
+        "fake_news_reports", {"user_id": user_id_obj}, "reported_at",
+        cursor=request.args.get('cursor'), limit=50
+    )
     
     # 4. Global Trends (Optional: Keep this global to show what's viral)
     # If you want this to be user-only too, add the {"user_id": user_id_obj} filter here as well.
-    trending_sources = list(db.fake_news_sources.find().sort([
-        ("report_count", -1), 
-        ("avg_confidence", -1)
-    ]).limit(20))
+    trending_sources = find_sources(limit=20)
     
     # 5. User-Specific Statistics
     # Count only this user's reports
@@ -1235,9 +2869,21 @@ def fake_news_tracker():
         total_reports=total_reports,
         avg_confidence=round(avg_confidence, 1),
         high_risk_count=high_risk_count,
+        next_cursor=next_cursor,
         username=session.get('username')
     )
 
+@app.route("/api/fake_news_reports")
+def api_fake_news_reports():
+    if 'user_id' not in session:
+        return jsonify({"status": "error", "message": "Not logged in"}), 401
+
+    reports, next_cursor = paginate(
+        "fake_news_reports", {"user_id": ObjectId(session['user_id'])}, "reported_at",
+        cursor=request.args.get('cursor'), limit=page_limit(request.args.get('limit'))
+    )
+    return page_json(reports, next_cursor)
+
 @app.route("/admin/dashboard")
 def admin_dashboard():
     if 'user_id' not in session:
@@ -1282,10 +2928,7 @@ def admin_dashboard():
     ]
     all_reports = list(db.fake_news_reports.aggregate(pipeline))
     
-    all_sources = list(db.fake_news_sources.find().sort([
-        ("report_count", -1), 
-        ("avg_confidence", -1)
-    ]))
+    all_sources = find_sources()
     
     total_users = db.users.count_documents({})
     total_reports = db.fake_news_reports.count_documents({})
@@ -1323,21 +2966,69 @@ def blacklist_source():
     
     return jsonify({"status": "success"})
 
+@app.route("/admin/cache_stats")
+def cache_stats():
+    if 'user_id' not in session:
+        return jsonify({"status": "error"}), 401
+
+    db = get_db()
+    user = db.users.find_one({"_id": ObjectId(session['user_id'])})
+
+    if not user or not user.get('is_admin'):
+        return jsonify({"status": "error", "message": "Admin privileges required"}), 403
+
+    return jsonify({
+        "news": news_cache.stats(),
+        "enrichment": enrichment_cache.stats(),
+        "translation": translation_cache.stats(),
+        "url_scans": url_scan_cache.stats(),
+        "social": social_cache.stats(),
+        "user_stats": user_stats_cache.stats(),
+        "history_buffer": history_buffer.stats(),
+        "news_inflight": news_flight.stats()
+    })
+
 @app.route("/api/news")
 def api_news():
-    news = newsapi.get_everything(
-        q='Philippines OR Manila OR "Philippine news"',
-        language="en",
-        sort_by="publishedAt",
-        page_size=15
-    )["articles"]
-    
-    news = filter_philippine_news(news)[:10]
+    news = get_feed_articles("api", 10)
 
     # ATTACH SOCIAL DATA (Global only)
     news = attach_social_data(news)
 
     return jsonify(news)
 
+# ---------- BACKGROUND SERVICES ----------
+# Started by the first request a process serves, so it works the same under
+# `python app.py`, `flask run` and WSGI servers (and the debug reloader's
+# watcher process, which never serves requests, starts nothing). With several
+# worker processes, set BACKGROUND_WORKERS=0 on all but one of them.
+BACKGROUND_WORKERS = os.environ.get("BACKGROUND_WORKERS", "1") != "0"
+
+_services_started = False
+_services_lock = threading.Lock()
+
+def start_background_services():
+    """Index bootstrap plus the ingestion / compaction workers, once per process"""
+    global _services_started
+    with _services_lock:
+        if _services_started:
+            return
+        _services_started = True
+
+    # Off the request path: index builds can take a while on big collections,
+    # and spawning the scoring workers costs a second or two
+    threading.Thread(target=ensure_indexes, daemon=True).start()
+    threading.Thread(target=warm_scoring_pool, daemon=True).start()
+    if BACKGROUND_WORKERS:
+        start_ingestion_worker()
+        start_compaction_worker()
+    else:
+        print("BACKGROUND_WORKERS=0: news ingestion and history compaction are not running in this process")
+
+@app.before_request
+def ensure_background_services():
+    if not _services_started:
+        start_background_services()
+
 if __name__ == "__main__":
     app.run(debug=True, port=5001)
\ No newline at end of file
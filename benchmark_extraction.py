@@ -0,0 +1,110 @@
+"""
+Benchmark: HTML extraction engines used by the article reader / URL scanner.
+
+    python benchmark_extraction.py [DIR_WITH_SAVED_PAGES]
+
+DIR should hold saved news pages (*.html, e.g. "Save Page As" from inquirer.net,
+rappler.com, philstar.com...). Without it a synthetic news-like corpus is used.
+"""
+import glob
+import os
+import random
+import sys
+import timeit
+
+from bs4 import BeautifulSoup
+
+from app import HTML_EXTRACTORS, extract_page
+
+# ---------- PREVIOUS IMPLEMENTATION ----------
+def old_read_article(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    paragraphs = soup.find_all('p')
+    content = '\n\n'.join([p.get_text().strip() for p in paragraphs if len(p.get_text().strip()) > 50])
+    img_tag = soup.find('meta', property='og:image')
+    image_url = img_tag['content'] if img_tag else None
+    return content, image_url
+
+def old_submit_fake_url(html):
+    soup = BeautifulSoup(html, 'html.parser')
+    title = soup.find('title').get_text().strip() if soup.find('title') else "Unknown Title"
+    meta_desc = soup.find('meta', attrs={'name': 'description'}) or \
+                soup.find('meta', attrs={'property': 'og:description'})
+    description = meta_desc['content'].strip() if meta_desc else ""
+    paragraphs = soup.find_all('p')
+    article_body = " ".join([p.get_text().strip() for p in paragraphs[:15]])
+    return title, description, article_body
+
+def new_read_article(html, engine):
+    page = extract_page(html, engine=engine)
+    content = '\n\n'.join([text for text in page["paragraphs"] if len(text) > 50])
+    return content, page["image_url"]
+
+def new_submit_fake_url(html, engine):
+    page = extract_page(html, engine=engine, max_paragraphs=15)
+    return page["title"] or "Unknown Title", page["description"], " ".join(page["paragraphs"])
+
+# ---------- CORPUS ----------
+WORDS = (
+    "Manila Senate DOH PAGASA typhoon barangay officials said residents Quezon City "
+    "Marcos administration budget relief goods province Cebu Davao Mindanao police "
+    "investigation flood warning the and of to in for on with by from at"
+).split()
+
+def synthetic_page(rng):
+    def sentence():
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(8, 25))).capitalize() + "."
+
+    nav = "".join(f'<li><a href="/section/{i}">{rng.choice(WORDS)}</a></li>' for i in range(60))
+    body = "".join(
+        f'<div class="ad-slot"><script>var slot{i} = {i};</script></div>'
+        f'<p>{" ".join(sentence() for _ in range(rng.randint(1, 5)))} <a href="/tag/{i}">{rng.choice(WORDS)}</a></p>'
+        for i in range(rng.randint(15, 45))
+    )
+    return (
+        "<!DOCTYPE html><html><head>"
+        f"<title>{sentence()} | Philippine News</title>"
+        f'<meta name="description" content="{sentence()}">'
+        f'<meta property="og:description" content="{sentence()}">'
+        f'<meta property="og:image" content="https://example.ph/img/{rng.randint(1, 999)}.jpg">'
+        f"<style>{'.c{color:red}' * 200}</style></head><body>"
+        f"<header><nav><ul>{nav}</ul></nav></header><main><article>{body}</article></main>"
+        f"<footer><p>Copyright {rng.randint(2000, 2026)}</p></footer></body></html>"
+    ).encode("utf-8")
+
+def load_corpus(directory=None):
+    if directory:
+        pages = []
+        for path in sorted(glob.glob(os.path.join(directory, "*.htm*"))):
+            with open(path, "rb") as f:
+                pages.append(f.read())
+        if pages:
+            return pages, directory
+    rng = random.Random(3)
+    return [synthetic_page(rng) for _ in range(40)], "synthetic"
+
+# ---------- RUN ----------
+def main():
+    pages, source = load_corpus(sys.argv[1] if len(sys.argv) > 1 else None)
+    size_kb = sum(len(p) for p in pages) / 1024
+    print(f"corpus: {source}, {len(pages)} pages, {size_kb:.0f} KB")
+
+    runs = 5
+    baseline = timeit.timeit(lambda: [old_read_article(p) for p in pages], number=runs)
+    print(f"{'read_article   old (html.parser)':40s} {baseline / runs / len(pages) * 1e3:7.2f} ms/page")
+    for engine in HTML_EXTRACTORS:
+        seconds = timeit.timeit(lambda: [new_read_article(p, engine) for p in pages], number=runs)
+        same = sum(old_read_article(p) == new_read_article(p, engine) for p in pages)
+        print(f"{'read_article   ' + engine:40s} {seconds / runs / len(pages) * 1e3:7.2f} ms/page"
+              f"  x{baseline / seconds:4.1f}  identical {same}/{len(pages)}")
+
+    baseline = timeit.timeit(lambda: [old_submit_fake_url(p) for p in pages], number=runs)
+    print(f"{'submit_fake_url old (html.parser)':40s} {baseline / runs / len(pages) * 1e3:7.2f} ms/page")
+    for engine in HTML_EXTRACTORS:
+        seconds = timeit.timeit(lambda: [new_submit_fake_url(p, engine) for p in pages], number=runs)
+        same = sum(old_submit_fake_url(p) == new_submit_fake_url(p, engine) for p in pages)
+        print(f"{'submit_fake_url ' + engine:40s} {seconds / runs / len(pages) * 1e3:7.2f} ms/page"
+              f"  x{baseline / seconds:4.1f}  identical {same}/{len(pages)}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Microbenchmark: keyword classification helpers, old `keyword in text` loops
+vs. the shared Aho-Corasick KeywordMatcher in scoring.py.
+
+    python benchmark_keywords.py
+"""
+import random
+import timeit
+
+import scoring
+from app import is_philippine_news, detect_category
+from scoring import (
+    PHILIPPINE_KEYWORDS, CATEGORY_KEYWORDS, HIGH_RISK_KEYWORDS, CLICKBAIT_KEYWORDS,
+    _cached_keyword_hits
+)
+
+# ---------- PREVIOUS IMPLEMENTATIONS ----------
+def old_is_philippine_news(article):
+    title = article.get('title', '').lower()
+    description = article.get('description', '').lower() if article.get('description') else ''
+    content = article.get('content', '').lower() if article.get('content') else ''
+    text_to_check = f"{title} {description} {content}"
+    return any(keyword in text_to_check for keyword in PHILIPPINE_KEYWORDS)
+
+def old_detect_category(title, description):
+    text = f"{title} {description}".lower()
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        if any(keyword in text for keyword in keywords):
+            return category
+    return 'General'
+
+# ---------- CORPUS ----------
+FILLER = (
+    "officials said on tuesday that the budget would be discussed by lawmakers "
+    "while residents of the province waited for relief goods after the weekend "
+    "as local leaders promised more support for affected families in the region"
+).split()
+
+ALL_KEYWORDS = sorted(
+    set(PHILIPPINE_KEYWORDS + HIGH_RISK_KEYWORDS + CLICKBAIT_KEYWORDS)
+    | {k for words in CATEGORY_KEYWORDS.values() for k in words}
+)
+
+def make_text(rng, words):
+    out = []
+    for _ in range(words):
+        if rng.random() < 0.04:
+            out.append(rng.choice(ALL_KEYWORDS).title() if rng.random() < 0.5 else rng.choice(ALL_KEYWORDS))
+        else:
+            out.append(rng.choice(FILLER))
+    return " ".join(out)
+
+def make_corpus(n=200, seed=7):
+    rng = random.Random(seed)
+    return [{
+        "title": make_text(rng, 12),
+        "description": make_text(rng, 40),
+        "content": make_text(rng, 35)
+    } for _ in range(n)]
+
+# ---------- RUN ----------
+def old_pipeline(articles):
+    for a in articles:
+        old_is_philippine_news(a)
+        old_detect_category(a["title"], a["description"])
+
+def new_pipeline(articles):
+    for a in articles:
+        is_philippine_news(a)
+        detect_category(a["title"], a["description"])
+
+def cold_new_pipeline(articles):
+    _cached_keyword_hits.cache_clear()
+    new_pipeline(articles)
+
+def main():
+    corpus = make_corpus()
+
+    # Same answers as before
+    for a in corpus:
+        assert old_is_philippine_news(a) == is_philippine_news(a)
+        assert old_detect_category(a["title"], a["description"]) == detect_category(a["title"], a["description"])
+
+    runs = 50
+    results = {
+        "old (keyword in text)": timeit.timeit(lambda: old_pipeline(corpus), number=runs),
+        "new, cold (scan every text)": timeit.timeit(lambda: cold_new_pipeline(corpus), number=runs),
+        "new, warm (repeat render)": timeit.timeit(lambda: new_pipeline(corpus), number=runs),
+    }
+
+    print(f"{len(corpus)} articles x {runs} runs, {len(scoring.keyword_matcher._delta)} automaton states")
+    for name, seconds in results.items():
+        print(f"{name:32s} {seconds / (runs * len(corpus)) * 1e6:8.2f} us/article")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,246 @@
+"""
+Fake news scoring and keyword matching.
+
+Kept out of app.py so the scoring process pool can import it without
+pulling in Flask, MongoDB, the executors and the API clients.
+"""
+from collections import deque
+from functools import lru_cache
+
+from textblob import TextBlob  # AI Library
+
+# ---------- KEYWORD MATCHING ----------
+PHILIPPINE_KEYWORDS = [
+    'philippines', 'philippine', 'manila', 'filipino', 'filipina',
+    'cebu', 'davao', 'mindanao', 'luzon', 'visayas',
+    'duterte', 'marcos', 'quezon', 'makati', 'pasig',
+    'senate', 'congress', 'doh', 'dilg', 'pnp',
+    'abs-cbn', 'gma', 'pba', 'gilas', 'pacquiao'
+]
+
+CATEGORY_KEYWORDS = {
+    'Politics': ['politics', 'government', 'election', 'senate', 'congress', 'president', 'mayor', 'duterte', 'marcos'],
+    'Business': ['business', 'economy', 'stock', 'market', 'company', 'trade', 'investment', 'peso', 'gdp'],
+    'Technology': ['technology', 'tech', 'smartphone', 'app', 'software', 'internet', 'digital', 'AI', 'gadget'],
+    'Sports': ['sports', 'basketball', 'boxing', 'football', 'pba', 'gilas', 'pacquiao', 'athlete', 'game'],
+    'Entertainment': ['entertainment', 'movie', 'celebrity', 'showbiz', 'abs-cbn', 'gma', 'actor', 'actress'],
+    'Health': ['health', 'medical', 'hospital', 'doctor', 'covid', 'vaccine', 'disease', 'doh', 'wellness'],
+    'Education': ['education', 'school', 'university', 'student', 'teacher', 'deped', 'ched', 'learning'],
+    'Environment': ['environment', 'climate', 'weather', 'typhoon', 'flood', 'pollution', 'pagasa', 'nature'],
+    'Crime': ['crime', 'police', 'arrest', 'murder', 'theft', 'pnp', 'investigation', 'suspect'],
+    'Weather': ['weather', 'typhoon', 'rain', 'storm', 'pagasa', 'forecast', 'temperature'],
+    'Lifestyle': ['lifestyle', 'fashion', 'travel', 'culture', 'art', 'tourism', 'food'],
+    'Food': ['food', 'restaurant', 'cuisine', 'recipe', 'chef', 'cooking', 'dining']
+}
+
+HIGH_RISK_KEYWORDS = [
+    "hoax", "conspiracy", "exposed", "secret", "shocking", 
+    "censored", "mainstream media", "government lies", "debunked",
+    "miracle cure", "bioweapon", "deep state", "wake up", "plot"
+]
+
+CLICKBAIT_KEYWORDS = [
+    "you won't believe", "shocking truth", "viral", "mind blowing", 
+    "this will change everything", "urgent", "breaking news", "omg"
+]
+
+class KeywordMatcher:
+    """
+    Aho-Corasick automaton over several named keyword groups.
+    Built once; scan() finds every keyword of every group in a single pass
+    over the text (plain substring semantics, same as `keyword in text`).
+    """
+    def __init__(self, groups):
+        self.groups = {group: tuple(words) for group, words in groups.items()}
+
+        # 1. Trie of all keywords
+        goto = [{}]
+        output = [set()]
+        for group, words in self.groups.items():
+            for word in words:
+                state = 0
+                for ch in word:
+                    nxt = goto[state].get(ch)
+                    if nxt is None:
+                        goto.append({})
+                        output.append(set())
+                        nxt = len(goto) - 1
+                        goto[state][ch] = nxt
+                    state = nxt
+                output[state].add((group, word))
+
+        # 2. Failure links (BFS), merging outputs of suffix states
+        fail = [0] * len(goto)
+        order = []
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            order.append(state)
+            for ch, nxt in goto[state].items():
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                output[nxt] |= output[fail[nxt]]
+                queue.append(nxt)
+
+        # 3. Resolve failures into a full transition table (one dict lookup per char)
+        delta = [None] * len(goto)
+        delta[0] = dict(goto[0])
+        for state in order:
+            table = dict(delta[fail[state]])
+            table.update(goto[state])
+            delta[state] = table
+
+        self._delta = delta
+        self._output = [tuple(out) if out else None for out in output]
+
+    def scan(self, text):
+        """Returns {group: frozenset(keywords found)} for groups with at least one hit"""
+        delta = self._delta
+        output = self._output
+        state = 0
+        found = []
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if output[state] is not None:
+                found.extend(output[state])
+
+        hits = {}
+        for group, word in found:
+            hits.setdefault(group, set()).add(word)
+        return {group: frozenset(words) for group, words in hits.items()}
+
+    def counts(self, text):
+        """Per-group number of distinct keywords found"""
+        return {group: len(words) for group, words in self.scan(text).items()}
+
+# Only the short, memoized texts go through the automaton. The fake news
+# keywords are checked on full article bodies with `in`, which is C-speed and
+# beats a pure-Python scan over the whole text.
+keyword_matcher = KeywordMatcher(dict(
+    CATEGORY_KEYWORDS,
+    philippine=PHILIPPINE_KEYWORDS
+))
+
+# Titles/descriptions repeat across renders and helpers, so short texts are memoized
+KEYWORD_CACHE_MAX_TEXT = 2000
+
+@lru_cache(maxsize=4096)
+def _cached_keyword_hits(text):
+    return keyword_matcher.scan(text)
+
+def keyword_hits(*texts):
+    """
+    Keyword hits ({group: frozenset}) across one or more lowercased texts.
+    Each text is scanned separately, so helpers that look at the same
+    title/description share one scan.
+    """
+    hits = {}
+    for text in texts:
+        if not text:
+            continue
+        if len(text) > KEYWORD_CACHE_MAX_TEXT:
+            text_hits = keyword_matcher.scan(text)
+        else:
+            text_hits = _cached_keyword_hits(text)
+        for group, words in text_hits.items():
+            hits[group] = hits[group] | words if group in hits else words
+    return hits
+
+# ---------- FAKE NEWS DETECTION ----------
+def detect_fake_news_advanced(text, url=""):
+    """
+    Realistic AI Scoring: Separates Risk from Confidence.
+    Returns: (label, confidence_percentage, ai_risk_score, reasons)
+    """
+    if not text or len(text) < 100:
+        return "VERIFY", 0, 5.0, ["Content too short for accurate analysis"]
+    
+    blob = TextBlob(text)
+    sentiment = blob.sentiment
+    reasons = []
+    
+    # 1. BASELINE RISK (Start at 50 - Neutral/Unsure)
+    risk_score = 50 
+    
+    # 2. DOMAIN CHECK (The strongest signal)
+    trusted_domains = [
+        'rappler.com', 'inquirer.net', 'abs-cbn.com', 'gma.network', 'philstar.com', 
+        'cnnphilippines.com', 'manilabulletin.com', 'bworldonline.com', 'pna.gov.ph',
+        'bbc.com', 'reuters.com', 'apnews.com', 'nytimes.com', 'yugatech.com', 
+        'spot.ph', 'spin.ph', 'pep.ph',"gmanetwork.com"
+    ]
+    
+    domain_match = False
+    if url:
+        domain_match = any(domain in url.lower() for domain in trusted_domains)
+    
+    if domain_match:
+        risk_score -= 40  # Massive trust boost -> Drops to ~10 Risk
+        reasons.append("Source is Verified & Trusted")
+    else:
+        risk_score += 10  # Slight suspicion for unknown sites -> Rises to ~60 Risk
+        reasons.append("Source unverified (Proceed with caution)")
+
+    # 3. AI SENTIMENT ANALYSIS (Reality Check)
+    if sentiment.subjectivity > 0.6:
+        if sentiment.polarity < -0.2:
+            risk_score += 20
+            reasons.append("High Subjectivity + Negativity Detected")
+        else:
+            risk_score += 10
+            reasons.append("Opinionated Content Detected")
+    elif sentiment.subjectivity < 0.3:
+        risk_score -= 10
+        reasons.append("Objective/Factual Writing Style")
+
+    # Extreme Emotion Check (Too angry or too happy = Clickbait)
+    if abs(sentiment.polarity) > 0.8:
+        risk_score += 15
+        reasons.append("Extreme Emotional Language")
+
+    # 4. KEYWORD & PATTERN ANALYSIS
+    text_lower = text.lower()
+    
+    found_high_risk = [w for w in HIGH_RISK_KEYWORDS if w in text_lower]
+    if found_high_risk:
+        risk_score += 25
+        reasons.append(f"Suspicious keyword: '{found_high_risk[0]}'")
+
+    found_clickbait = [w for w in CLICKBAIT_KEYWORDS if w in text_lower]
+    if found_clickbait:
+        risk_score += 10
+        reasons.append(f"Clickbait style: '{found_clickbait[0]}'")
+
+    # 5. REALITY SCORING FORMULA
+    # Clamp Risk Score (0 = Safe, 100 = Fake)
+    final_risk = min(100, max(0, risk_score))
+    
+    # AI Score (0-10) for display. 
+    # High Score = High Risk of being Fake.
+    ai_score = round(final_risk / 10, 1)
+
+    # CONFIDENCE CALCULATION
+    confidence = abs(final_risk - 50) * 2
+    
+    # Boost confidence if we have a lot of text to analyze
+    if len(text) > 1000:
+        confidence = min(100, confidence + 10)
+
+    # Determine Label based on Risk
+    if final_risk >= 80:
+        label = "FAKE"
+    elif final_risk >= 70:
+        label = "SUSPICIOUS"
+    elif final_risk >= 50:
+        label = "VERIFY"
+    else:
+        label = "CREDIBLE"
+
+    return label, int(confidence), ai_score, reasons
+
+def score_item(item):
+    """Process pool entry point: detect_fake_news_advanced over a (text, url) pair"""
+    text, url = item
+    return detect_fake_news_advanced(text, url)
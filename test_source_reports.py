@@ -0,0 +1,58 @@
+"""
+Concurrency check: parallel fake news reports for one domain must all be
+counted by record_source_report's atomic upsert.
+
+    python -m pytest test_source_reports.py
+
+Needs a local MongoDB (mongodb://localhost:27017/); skipped otherwise.
+Runs against a scratch database (with the app's fake_news_sources indexes)
+that is dropped afterwards.
+"""
+import threading
+
+import pytest
+from pymongo import MongoClient
+from pymongo.errors import PyMongoError
+
+import app
+
+THREADS = 16
+REPORTS_PER_THREAD = 25
+TEST_DB = "truebayan_test_source_reports"
+
+@pytest.fixture
+def scratch_db(monkeypatch):
+    try:
+        MongoClient("mongodb://localhost:27017/", serverSelectionTimeoutMS=1000).admin.command("ping")
+    except PyMongoError:
+        pytest.skip("no local MongoDB at mongodb://localhost:27017/")
+
+    app.client.drop_database(TEST_DB)
+    monkeypatch.setattr(app, "db", app.client[TEST_DB])
+    # Concurrent upserts only stay one document per domain with the unique index
+    assert app.ensure_indexes(["fake_news_sources"]) == 0
+    yield app.db
+    app.client.drop_database(TEST_DB)
+
+def test_parallel_reports_are_all_counted(scratch_db):
+    start = threading.Barrier(THREADS)
+
+    def report(worker):
+        start.wait()
+        for i in range(REPORTS_PER_THREAD):
+            app.record_source_report(f"https://hoax.example.ph/story/{worker}-{i}", worker % 5 * 10 + 10)
+
+    threads = [threading.Thread(target=report, args=(n,)) for n in range(THREADS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    expected_total = sum((n % 5 * 10 + 10) * REPORTS_PER_THREAD for n in range(THREADS))
+    docs = list(scratch_db.fake_news_sources.find({"domain": "hoax.example.ph"}))
+    assert len(docs) == 1
+    assert docs[0]["report_count"] == THREADS * REPORTS_PER_THREAD
+    assert docs[0]["total_confidence"] == expected_total
+
+    source = app.find_sources(limit=1)[0]
+    assert source["avg_confidence"] == pytest.approx(expected_total / (THREADS * REPORTS_PER_THREAD))